@@ -1,5 +1,7 @@
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 
@@ -22,15 +24,18 @@ class DocChunker:
         min_chunk_size (int | None): Minimum target number of characters per paragraph chunk.
             Consecutive small paragraphs under the same heading context are merged until
             this size is reached (while staying within chunk_size). Defaults to chunk_size // 4.
+        stream_tables (bool): Read DOCX table rows lazily while chunking instead of
+            materializing each table up front. Lowers peak memory on large tables. Default: False.
     """
 
-    def __init__(self, chunk_size: int = 1000, num_overlapping_elements: int = 0, min_chunk_size: int | None = None):
+    def __init__(self, chunk_size: int = 1000, num_overlapping_elements: int = 0, min_chunk_size: int | None = None, stream_tables: bool = False):
         self.chunk_size = chunk_size
         self.num_overlapping_elements = num_overlapping_elements
         self.min_chunk_size = min_chunk_size
+        self.stream_tables = stream_tables
 
         self.processors = {
-            "docx": DocxProcessor(chunk_size=chunk_size, num_overlapping_elements=num_overlapping_elements, min_chunk_size=min_chunk_size),
+            "docx": DocxProcessor(chunk_size=chunk_size, num_overlapping_elements=num_overlapping_elements, min_chunk_size=min_chunk_size, stream_tables=stream_tables),
             "pdf": PdfProcessor(chunk_size=chunk_size, num_overlapping_elements=num_overlapping_elements, min_chunk_size=min_chunk_size),
         }
 
@@ -92,6 +97,33 @@ class DocChunker:
             all_chunks.extend(chunks)
         return all_chunks
 
+    def process_many(self, file_paths: list[str | Path], max_workers: int | None = None) -> dict[str, list[Chunk]]:
+        """Process several documents in parallel worker processes.
+
+        Parsing is CPU-bound pure Python, so documents are fanned out over a
+        process pool rather than threads.
+
+        Args:
+            file_paths: Paths of the documents to process
+            max_workers: Number of worker processes (defaults to the CPU count).
+                With 1, documents are processed serially in this process.
+
+        Returns:
+            Mapping from each path (as a string) to its chunks, in input order
+
+        Raises:
+            FileNotFoundError: If a file does not exist
+            ValueError: If a file format is not supported
+        """
+        paths = [str(file_path) for file_path in file_paths]
+        if max_workers == 1 or len(paths) <= 1:
+            return {path: self.process_document(path) for path in paths}
+        # Workers get the configuration, not this instance: its parsers may
+        # hold per-document state (lxml elements) that cannot be pickled.
+        config = (self.chunk_size, self.num_overlapping_elements, self.min_chunk_size, self.stream_tables)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(partial(_process_document_in_worker, config), paths)))
+
     def export_chunks_to_json(self, chunks: list[Chunk], output_file: str | Path) -> None:
         """
         Export chunks to a JSON file.
@@ -104,4 +136,16 @@ class DocChunker:
                 [{"text": c.text, "metadata": c.metadata} for c in chunks],
                 f,
                 indent=2
-            )
\ No newline at end of file
+            )
+
+
+def _process_document_in_worker(config: tuple, file_path: str) -> list[Chunk]:
+    """Process one document with a fresh DocChunker built from ``config``."""
+    chunk_size, num_overlapping_elements, min_chunk_size, stream_tables = config
+    chunker = DocChunker(
+        chunk_size=chunk_size,
+        num_overlapping_elements=num_overlapping_elements,
+        min_chunk_size=min_chunk_size,
+        stream_tables=stream_tables,
+    )
+    return chunker.process_document(file_path)
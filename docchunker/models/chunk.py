@@ -8,6 +8,10 @@ from typing import Any
 
 @dataclass
 class Chunk:
+    # Declared by hand (rather than dataclass(slots=True), Python 3.10+) so
+    # chunks carry no per-instance __dict__; large documents produce many.
+    __slots__ = ("text", "metadata")
+
     text: str
     metadata: dict[str, Any]
 
@@ -25,35 +25,40 @@ class DocumentChunker:
 
     def _stringify_node_content(self, node: dict[str, Any], indent_level: int = 0) -> str:
         """
-        Recursively stringifies a node and its children.
+        Stringifies a node and its children, one line per node in document order.
         No heading context prepended here; that's handled by _create_chunk_text.
+
+        The subtree is walked with an explicit stack rather than recursion, so
+        deeply nested lists cost no Python call frames per level.
         """
-        parts = []
-        indent = "  " * indent_level
-
-        node_type = node.get('type', 'unknown')
-
-        if node_type == 'paragraph':
-            parts.append(indent + node.get('content', ''))
-        elif node_type == 'list_item':
-            marker_level = node.get('level', 0) # 0-indexed ilvl
-            # Basic list marker, could be improved with actual numbering/bullet style
-            # Using a simple alternating marker for demonstration
-            marker = "- " if node.get('num_id', -1) == -1 or marker_level % 2 == 0 else f"{marker_level + 1}. "
-            parts.append(indent + marker + node.get('content', ''))
-        elif node_type == 'table':
-            parts.append(indent + "Table:\n" + indent + node.get('content', '').replace("\n", "\n" + indent))
-        elif node_type == 'heading':
-            parts.append(indent + f"H{node.get('level', 0)}: {node.get('content', '')}")
-        elif node_type == 'list_container':
-            # Content comes from children, handled in recursion below
-            pass
-
-        if 'children' in node and node['children']:
-            for child_node in node['children']:
-                child_indent_level = indent_level + 1 if node_type in ['list_item', 'list_container'] else indent_level
-                parts.append(self._stringify_node_content(child_node, child_indent_level))
-        
+        parts: list[str] = []
+        stack: list[tuple[dict[str, Any], int]] = [(node, indent_level)]
+
+        while stack:
+            current, level = stack.pop()
+            indent = "  " * level
+            node_type = current.get('type', 'unknown')
+
+            if node_type == 'paragraph':
+                parts.append(indent + current.get('content', ''))
+            elif node_type == 'list_item':
+                marker_level = current.get('level', 0) # 0-indexed ilvl
+                # Basic list marker, could be improved with actual numbering/bullet style
+                # Using a simple alternating marker for demonstration
+                marker = "- " if current.get('num_id', -1) == -1 or marker_level % 2 == 0 else f"{marker_level + 1}. "
+                parts.append(indent + marker + current.get('content', ''))
+            elif node_type == 'table':
+                parts.append(indent + "Table:\n" + indent + current.get('content', '').replace("\n", "\n" + indent))
+            elif node_type == 'heading':
+                parts.append(indent + f"H{current.get('level', 0)}: {current.get('content', '')}")
+            # list_container (and unknown types) contribute only their children
+
+            children = current.get('children')
+            if children:
+                child_indent_level = level + 1 if node_type in ['list_item', 'list_container'] else level
+                # Reversed so the first child is popped (and emitted) first.
+                stack.extend((child_node, child_indent_level) for child_node in reversed(children))
+
         return "\n".join(filter(None, parts)) # Filter out empty strings that might result from empty nodes
 
     def _create_chunk_text(self, headings: list[str], content_text: str) -> str:
@@ -83,21 +88,9 @@ class DocumentChunker:
         """
         table_header = node.get('header', [])
         data_rows = node.get('data_rows', [])
-
-        if not data_rows:
-            # If there are no data rows, but there's a header, maybe stringify just the header?
-            # Or, if table is truly empty, stringify the node as a simple table placeholder.
-            # For now, if no data_rows, we can create a simple representation or skip.
-            if table_header:
-                header_text = "Table Header: " + " | ".join(table_header)
-                full_chunk_text = self._create_chunk_text(current_headings, header_text)
-                metadata = {
-                    "document_id": document_id, "source_type": source_format,
-                    "node_type": "table_header_only", "headings": list(current_headings),
-                    "num_chars": len(full_chunk_text)
-                }
-                chunks.append(Chunk(text=full_chunk_text, metadata=metadata))
-            return
+        if callable(data_rows):
+            # Streaming parsers hand over a factory that yields rows on demand.
+            data_rows = data_rows()
 
         current_chunk_row_data_list: list[list[str]] = []
         current_chunk_rows_text_parts: list[str] = []
@@ -105,6 +98,8 @@ class DocumentChunker:
         headings_prefix_text = self._create_chunk_text(current_headings, "")
         headings_chars = len(headings_prefix_text)
         current_content_chars = 0
+        # Scan the already emitted chunks once up front instead of on every flush.
+        has_table_chunks = any(c.metadata.get("node_type") == "table_rows" for c in chunks)
 
         for i, row_data in enumerate(data_rows):
             formatted_row_text = self._format_table_row(table_header, row_data)
@@ -117,8 +112,7 @@ class DocumentChunker:
                 final_chunk_text = self._create_chunk_text(current_headings, chunk_content_str)
                 
                 # Add overlap metadata - check if this is the first chunk for this specific table
-                table_chunks_so_far = len([c for c in chunks if c.metadata.get("node_type") == "table_rows"])
-                is_first_table_chunk = table_chunks_so_far == 0
+                is_first_table_chunk = not has_table_chunks
                 metadata = {
                     "document_id": document_id, "source_type": source_format,
                     "node_type": "table_rows", "headings": list(current_headings),
@@ -127,6 +121,7 @@ class DocumentChunker:
                     "overlap_elements": 0 if is_first_table_chunk else min(self.num_overlapping_elements, len(current_chunk_row_data_list))
                 }
                 chunks.append(Chunk(text=final_chunk_text, metadata=metadata))
+                has_table_chunks = True
 
                 if self.num_overlapping_elements > 0 and len(current_chunk_row_data_list) >= self.num_overlapping_elements:
                     overlap_row_data = current_chunk_row_data_list[-self.num_overlapping_elements:]
@@ -146,8 +141,7 @@ class DocumentChunker:
             final_chunk_text = self._create_chunk_text(current_headings, chunk_content_str)
             
             # Add overlap metadata for final chunk
-            table_chunks_so_far = len([c for c in chunks if c.metadata.get("node_type") == "table_rows"])
-            is_first_table_chunk = table_chunks_so_far == 0
+            is_first_table_chunk = not has_table_chunks
             metadata = {
                 "document_id": document_id, "source_type": source_format,
                 "node_type": "table_rows", "headings": list(current_headings),
@@ -156,6 +150,16 @@ class DocumentChunker:
                 "overlap_elements": 0 if is_first_table_chunk else min(self.num_overlapping_elements, len(current_chunk_row_data_list))
             }
             chunks.append(Chunk(text=final_chunk_text, metadata=metadata))
+        elif table_header:
+            # No data rows at all: emit the header alone so the table is not lost.
+            header_text = "Table Header: " + " | ".join(table_header)
+            full_chunk_text = self._create_chunk_text(current_headings, header_text)
+            metadata = {
+                "document_id": document_id, "source_type": source_format,
+                "node_type": "table_header_only", "headings": list(current_headings),
+                "num_chars": len(full_chunk_text)
+            }
+            chunks.append(Chunk(text=full_chunk_text, metadata=metadata))
 
 
     def _process_list_container(self, node: dict[str, Any], current_headings: list[str], chunks: list[Chunk], document_id: str, source_format: str = "docx"):
@@ -173,6 +177,8 @@ class DocumentChunker:
         headings_prefix_text = self._create_chunk_text(current_headings, "")
         headings_chars = len(headings_prefix_text)
         current_content_chars = 0
+        # Scan the already emitted chunks once up front instead of on every flush.
+        has_list_chunks = any(c.metadata.get("node_type") == "list_container" for c in chunks)
 
         for i, item_node in enumerate(list_items):
             item_text = self._stringify_node_content(item_node, indent_level=0) # Indent relative to list container
@@ -186,8 +192,7 @@ class DocumentChunker:
                 final_chunk_text = self._create_chunk_text(current_headings, chunk_content_str)
                 
                 # Add overlap metadata - check if this is the first chunk for this specific list container
-                list_chunks_so_far = len([c for c in chunks if c.metadata.get("node_type") == "list_container"])
-                is_first_list_chunk = list_chunks_so_far == 0
+                is_first_list_chunk = not has_list_chunks
                 metadata = {
                     "document_id": document_id, 
                     "source_type": source_format,
@@ -198,6 +203,7 @@ class DocumentChunker:
                     "overlap_elements": 0 if is_first_list_chunk else min(self.num_overlapping_elements, len(current_chunk_item_nodes))
                 }
                 chunks.append(Chunk(text=final_chunk_text, metadata=metadata))
+                has_list_chunks = True
 
                 # TODO: revisit this logic if num_overlapping_elements > 0: only apply it if the previous chunk had significantly more items than the overlap count
                 if self.num_overlapping_elements > 0 and len(current_chunk_item_nodes) >= self.num_overlapping_elements:
@@ -220,8 +226,7 @@ class DocumentChunker:
             final_chunk_text = self._create_chunk_text(current_headings, chunk_content_str)
             
             # Add overlap metadata for final chunk
-            list_chunks_so_far = len([c for c in chunks if c.metadata.get("node_type") == "list_container"])
-            is_first_list_chunk = list_chunks_so_far == 0
+            is_first_list_chunk = not has_list_chunks
             metadata = {
                 "document_id": document_id, 
                 "source_type": source_format,
@@ -275,8 +280,12 @@ class DocumentChunker:
             pieces.append(" ".join(current_parts))
         return pieces
 
-    def _emit_paragraph_group(self, paragraph_texts: list[str], current_headings: list[str], chunks: list[Chunk], document_id: str, source_format: str):
-        """Emits one chunk for a group of one or more merged paragraphs."""
+    def _emit_paragraph_group(self, paragraph_texts: list[str], current_headings: list[str], chunks: list[Chunk], document_id: str, source_format: str, overlap_count: int = 0):
+        """Emits one chunk for a group of one or more merged paragraphs.
+
+        ``overlap_count`` is the number of leading paragraphs repeated from the
+        previous chunk (see _paragraph_overlap).
+        """
         if not paragraph_texts:
             return
         content = self.PARAGRAPH_SEPARATOR.join(paragraph_texts)
@@ -290,8 +299,25 @@ class DocumentChunker:
         }
         if len(paragraph_texts) > 1:
             metadata["num_merged_elements"] = len(paragraph_texts)
+        if self.num_overlapping_elements > 0:
+            metadata["has_overlap"] = overlap_count > 0
+            metadata["overlap_elements"] = overlap_count
         chunks.append(Chunk(text=chunk_text, metadata=metadata))
 
+    def _paragraph_overlap(self, emitted_group: list[str], budget_chars: int) -> list[str]:
+        """
+        Returns the trailing paragraphs of an emitted group to repeat at the start
+        of the next group: the last num_overlapping_elements paragraphs, dropping
+        the oldest ones until they (with separators) fit within budget_chars.
+        """
+        if self.num_overlapping_elements <= 0 or len(emitted_group) < self.num_overlapping_elements:
+            return []
+        carried = emitted_group[-self.num_overlapping_elements:]
+        separator_chars = len(self.PARAGRAPH_SEPARATOR)
+        while carried and sum(len(text) + separator_chars for text in carried) > budget_chars:
+            carried = carried[1:]
+        return carried
+
     def _emit_split_paragraph(self, content: str, current_headings: list[str], chunks: list[Chunk], document_id: str, source_format: str, available_chars: int):
         """Emits multiple chunks for a single paragraph larger than the chunk size."""
         pieces = self._split_oversized_paragraph(content, available_chars)
@@ -319,6 +345,10 @@ class DocumentChunker:
           sentence boundaries into multiple chunks.
         - Consecutive paragraphs are merged while the current group is smaller
           than min_chunk_size and the combined chunk stays within chunk_size.
+        - With num_overlapping_elements > 0, each new group starts with the
+          last paragraphs of the previous group (as far as they fit), so
+          adjacent paragraph chunks overlap like list items and table rows.
+          Split pieces of an oversized paragraph never overlap.
         """
         if not paragraph_buffer:
             return
@@ -328,15 +358,17 @@ class DocumentChunker:
 
         current_group: list[str] = []
         current_content_chars = 0
+        overlap_count = 0
 
         for paragraph_text in paragraph_buffer:
             paragraph_chars = len(paragraph_text)
 
             if paragraph_chars > available_chars:
                 # Oversized paragraph: flush any pending group, then split it.
-                self._emit_paragraph_group(current_group, current_headings, chunks, document_id, source_format)
+                self._emit_paragraph_group(current_group, current_headings, chunks, document_id, source_format, overlap_count)
                 current_group = []
                 current_content_chars = 0
+                overlap_count = 0
                 self._emit_split_paragraph(paragraph_text, current_headings, chunks, document_id, source_format, available_chars)
                 continue
 
@@ -345,15 +377,16 @@ class DocumentChunker:
             would_overflow = current_content_chars + separator_chars + paragraph_chars > available_chars
 
             if current_group and (group_is_large_enough or would_overflow):
-                self._emit_paragraph_group(current_group, current_headings, chunks, document_id, source_format)
-                current_group = []
-                current_content_chars = 0
-                separator_chars = 0
+                self._emit_paragraph_group(current_group, current_headings, chunks, document_id, source_format, overlap_count)
+                current_group = self._paragraph_overlap(current_group, available_chars - paragraph_chars)
+                overlap_count = len(current_group)
+                current_content_chars = len(self.PARAGRAPH_SEPARATOR.join(current_group))
+                separator_chars = len(self.PARAGRAPH_SEPARATOR) if current_group else 0
 
             current_group.append(paragraph_text)
             current_content_chars += separator_chars + paragraph_chars
 
-        self._emit_paragraph_group(current_group, current_headings, chunks, document_id, source_format)
+        self._emit_paragraph_group(current_group, current_headings, chunks, document_id, source_format, overlap_count)
         paragraph_buffer.clear()
 
     def _consolidate_recursive(self, nodes: list[dict[str, Any]], current_headings: list[str], chunks: list[Chunk], document_id: str, source_format: str = "docx"):
@@ -1,16 +1,50 @@
 import logging
+import math
 import re
 from collections import Counter
-from typing import Any, Union, BinaryIO
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterator, Union, BinaryIO
 import docx
+from docx.enum.style import WD_STYLE_TYPE
 from docx.table import Table
 from docx.text.paragraph import Paragraph
 import docx.document
-from docx.oxml.table import CT_Tbl
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
+from docx.oxml.table import CT_Row, CT_Tc
 from docx.oxml.text.paragraph import CT_P
 
 logger = logging.getLogger(__name__)
 
+# Qualified tag names of the body-level elements the parser handles. Comparing
+# ``element.tag`` against these is cheaper than isinstance() checks against the
+# python-docx oxml class hierarchy.
+_P_TAG = qn('w:p')
+_TBL_TAG = qn('w:tbl')
+
+# Hierarchy node types that are closed by any following heading, paragraph or table.
+_LIST_NODE_TYPES = frozenset({'list_container', 'list_item'})
+
+
+@lru_cache(maxsize=64)
+def _xpath(expression: str) -> etree.XPath:
+    """Compile an XPath expression over the WordprocessingML namespaces once.
+
+    ``BaseOxmlElement.xpath()`` re-parses its expression string on every call;
+    a compiled ``etree.XPath`` is reused across elements and documents.
+    """
+    return etree.XPath(expression, namespaces=nsmap)
+
+
+def _paragraph_text(p: CT_P) -> str:
+    """Text of a ``w:p`` element, including runs inside hyperlinks.
+
+    Same result as python-docx 1.x ``Paragraph.text``. The runs are read
+    directly because python-docx<1.0 has no ``w:hyperlink`` element class,
+    so a hyperlink's ``.text`` is lxml's (None, not its runs' text).
+    """
+    return "".join(r.text for r in _xpath("w:r | w:hyperlink/w:r")(p))
+
 
 class DocxParser:
     """Parses DOCX to a hierarchical structure of elements.
@@ -52,17 +86,27 @@ class DocxParser:
     BULLET_PREFIXES = ('- ', '• ', '* ')
     #: Matches "1 Title", "2. Title", "2.3 Title", "2.3.1 Title", ...
     NUMBERING_PREFIX_RE = re.compile(r"^(\d+(?:\.\d+)*)\.?\s+\S")
+    #: Text-based list markers for paragraphs without numbering XML or a list
+    #: style: a bullet prefix ("- ", "• ", "* ") or a 1-2 digit "N." number.
+    TEXT_LIST_MARKER_RE = re.compile(r"[-•*] |\d{1,2}\.")
 
-    def __init__(self, infer_headings: bool = True):
+    def __init__(self, infer_headings: bool = True, stream_tables: bool = False):
         """
         Args:
             infer_headings: When True (default), infer headings from formatting
                 in documents that contain no styled headings. Styled documents
                 are never affected by this flag.
+            stream_tables: When True, table ``data_rows`` is a zero-argument
+                callable returning an iterator over the data rows instead of a
+                materialized list, so large tables are read row by row while
+                chunking. Defaults to False (plain lists).
         """
         self.current_heading_level = 0
         self.infer_headings = infer_headings
+        self.stream_tables = stream_tables
         self._inferred_heading_levels: dict[CT_P, int] = {}
+        self._paragraph_style_names: dict[str, str] = {}
+        self._default_paragraph_style_name = ""
 
     def apply(self, file_input: Union[str, BinaryIO]) -> list[dict[str, Any]]:
         """Parse DOCX and return a hierarchical list of element dictionaries.
@@ -72,18 +116,55 @@ class DocxParser:
         """
         doc = docx.Document(file_input)
         self.current_heading_level = 0
+        self._load_paragraph_style_names(doc)
+        paragraph_texts = self._non_empty_paragraph_texts(doc)
         self._inferred_heading_levels = (
-            self._infer_heading_levels(doc) if self.infer_headings else {}
+            self._infer_heading_levels(doc, paragraph_texts) if self.infer_headings else {}
         )
 
-        hierarchical_elements = self._parse_content_elements(doc)
+        hierarchical_elements = self._parse_content_elements(doc, paragraph_texts)
         return hierarchical_elements
 
+    def _load_paragraph_style_names(self, doc: docx.document.Document) -> None:
+        """Resolve the UI names of the document's paragraph styles once, by style ID.
+
+        ``Paragraph.style`` looks the style up in the styles part on every
+        access; :meth:`_style_name` instead reads the paragraph's ``w:pStyle``
+        value and looks it up here, with the same fallbacks (unknown or
+        missing IDs resolve to the default paragraph style).
+        """
+        self._paragraph_style_names = {}
+        for style in doc.styles:
+            if style.type == WD_STYLE_TYPE.PARAGRAPH:
+                # python-docx resolves duplicate IDs to the first definition.
+                self._paragraph_style_names.setdefault(style.style_id, style.name or "")
+        default_style = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        self._default_paragraph_style_name = (default_style.name or "") if default_style is not None else ""
+
+    def _style_name(self, p: CT_P) -> str:
+        """Paragraph style name of a ``w:p`` element; same as ``Paragraph.style.name``."""
+        style_id = _xpath("string(w:pPr/w:pStyle/@w:val)")(p)
+        return self._paragraph_style_names.get(style_id, self._default_paragraph_style_name)
+
+    @staticmethod
+    def _non_empty_paragraph_texts(doc: docx.document.Document) -> dict[CT_P, str]:
+        """Stripped text of every non-empty body paragraph, in document order.
+
+        Computed once per document and shared by heading inference and the
+        main parse, so empty paragraphs are dropped before any style or list
+        classification and no paragraph text is extracted twice.
+        """
+        return {
+            p: text
+            for p in doc.element.body.p_lst
+            if (text := _paragraph_text(p).strip())
+        }
+
     # ------------------------------------------------------------------
     # Heading inference for unstyled documents
     # ------------------------------------------------------------------
 
-    def _infer_heading_levels(self, doc: docx.document.Document) -> dict[CT_P, int]:
+    def _infer_heading_levels(self, doc: docx.document.Document, paragraph_texts: dict[CT_P, str]) -> dict[CT_P, int]:
         """Infer heading levels for documents that use no heading styles.
 
         Rules (deterministic, applied in this order):
@@ -110,21 +191,23 @@ class DocxParser:
            document's paragraphs qualify, the signals are deemed unreliable
            (e.g. a fully bold document) and nothing is inferred.
 
+        Args:
+            doc: The parsed document.
+            paragraph_texts: Non-empty body paragraph texts
+                (see :meth:`_non_empty_paragraph_texts`).
+
         Returns:
             Mapping from paragraph XML element (``CT_P``) to inferred level.
         """
-        paragraphs = doc.paragraphs
-        if any(p.style.name.startswith('Heading') for p in paragraphs):
+        if any(self._style_name(p).startswith('Heading') for p in doc.element.body.p_lst):
             return {}
 
         candidates: list[dict[str, Any]] = []
         body_sizes: list[float] = []
-        total_non_empty = 0
-        for para in paragraphs:
-            text = para.text.strip()
-            if not text:
-                continue
-            total_non_empty += 1
+        total_non_empty = len(paragraph_texts)
+        body = doc._body
+        for p, text in paragraph_texts.items():
+            para = Paragraph(p, body)
             features = self._heading_signal_features(para, text)
             if features is None:
                 body_sizes.extend(self._explicit_run_sizes(para))
@@ -184,7 +267,7 @@ class DocxParser:
         # List items (explicit numbering XML or list styles) are never headings.
         if para._p.pPr is not None and para._p.pPr.numPr is not None:
             return None
-        style_name_lower = para.style.name.lower()
+        style_name_lower = self._style_name(para._p).lower()
         if 'list' in style_name_lower or 'bullet' in style_name_lower or 'number' in style_name_lower:
             return None
 
@@ -238,36 +321,51 @@ class DocxParser:
             pass
         return self.DEFAULT_BODY_FONT_SIZE_PT
     
-    def _parse_content_elements(self, document_object: docx.document.Document) -> list[dict[str, Any]]:
-        """Parses a sequence of XML elements and reconstructs them into a hierarchical list."""
+    def _parse_content_elements(self, document_object: docx.document.Document, paragraph_texts: dict[CT_P, str]) -> list[dict[str, Any]]:
+        """Parses a sequence of XML elements and reconstructs them into a hierarchical list.
+
+        Paragraphs missing from ``paragraph_texts`` are empty and are skipped.
+        """
         root_nodes: list[dict[str, Any]] = []
         parent_stack: list[dict[str, Any]] = []
+        # Section properties, bookmarks, content controls etc. are tallied and
+        # reported once instead of logging per element.
+        skipped_elements: Counter[str] = Counter()
+        # Paragraph/Table wrappers are built directly around each body element;
+        # looking them up in doc.paragraphs/doc.tables rebuilt both lists and
+        # scanned them for every element (quadratic in document length).
+        body = document_object._body
         xml_element_iterator = document_object.element.body.iterchildren()
         for element in xml_element_iterator:
             element_data: dict[str, Any] | None = None
-            if isinstance(element, CT_P):
-                para = self._find_paragraph(document_object, element)
-                if para and para.text and para.text.strip():
-                    element_data = self._process_paragraph(para)
-            elif isinstance(element, CT_Tbl):
-                table = self._find_table(document_object, element)
-                if table:
-                    element_data = self._process_table(table)
+            tag = element.tag
+            if tag == _P_TAG:
+                text = paragraph_texts.get(element)
+                if text is not None:
+                    element_data = self._process_paragraph(Paragraph(element, body), text)
+            elif tag == _TBL_TAG:
+                element_data = self._process_table(Table(element, body))
             else:
-                logger.debug("Skipping unsupported element type: %s", type(element))
+                skipped_elements[type(element).__name__] += 1
                 continue
 
             if not element_data:
                 continue
 
-            # Create the node for the current element, adding a 'children' list
-            node = {**element_data, 'children': []}
+            # The freshly built element dict becomes the node; add its 'children' list
+            node = element_data
+            node['children'] = []
 
-            if node['type'] == 'heading':
-                while parent_stack and \
-                        ((parent_stack[-1]['type'] == 'heading' and parent_stack[-1]['level'] >= node['level']) or \
-                        (parent_stack[-1]['type'] in ['list_container', 'list_item'])):
-                    parent_stack.pop()
+            node_type = node['type']
+            if node_type == 'heading':
+                heading_level = node['level']
+                while parent_stack:
+                    top = parent_stack[-1]
+                    top_type = top['type']
+                    if top_type in _LIST_NODE_TYPES or (top_type == 'heading' and top['level'] >= heading_level):
+                        parent_stack.pop()
+                    else:
+                        break
 
                 if not parent_stack:
                     root_nodes.append(node)
@@ -275,24 +373,24 @@ class DocxParser:
                     parent_stack[-1]['children'].append(node)
                 parent_stack.append(node)
 
-            elif node['type'] == 'list_item':
+            elif node_type == 'list_item':
                 li_level = node['level']
                 li_num_id = node['num_id']
 
                 while parent_stack:
                     p_on_stack = parent_stack[-1]
-                    if p_on_stack['type'] == 'list_container':
-                        if p_on_stack['num_id'] == li_num_id:
-                            if p_on_stack['level'] == li_level: break
-                            elif p_on_stack['level'] < li_level: break
-                            else: parent_stack.pop()
-                        else: parent_stack.pop()
-                    elif p_on_stack['type'] == 'list_item':
-                        if p_on_stack['num_id'] == li_num_id and li_level > p_on_stack['level']: break
-                        else: parent_stack.pop()
-                    elif p_on_stack['type'] == 'heading': break
-                    else:
-                        parent_stack.pop()
+                    p_type = p_on_stack['type']
+                    if p_type == 'heading':
+                        break
+                    if p_type == 'list_container':
+                        # Same list at this level or shallower: attach here or below
+                        if p_on_stack['num_id'] == li_num_id and p_on_stack['level'] <= li_level:
+                            break
+                    elif p_type == 'list_item':
+                        # Same list, deeper level: nest under this item
+                        if p_on_stack['num_id'] == li_num_id and li_level > p_on_stack['level']:
+                            break
+                    parent_stack.pop()
 
                 current_parent_on_stack = parent_stack[-1] if parent_stack else None
 
@@ -316,8 +414,8 @@ class DocxParser:
                     parent_stack.append(list_container_node)
                     parent_stack.append(node)
 
-            elif node['type'] in ['paragraph', 'table']:
-                while parent_stack and parent_stack[-1]['type'] in ['list_item', 'list_container']:
+            elif node_type in ('paragraph', 'table'):
+                while parent_stack and parent_stack[-1]['type'] in _LIST_NODE_TYPES:
                     parent_stack.pop()
                 
                 if not parent_stack:
@@ -325,29 +423,18 @@ class DocxParser:
                 else:
                     parent_stack[-1]['children'].append(node)
 
+        if skipped_elements:
+            logger.debug("Skipped unsupported element types: %s", dict(skipped_elements))
         return root_nodes
 
-    def _find_paragraph(self, doc: docx.document.Document, element: CT_P) -> Paragraph:
-        """Find paragraph object by XML element"""
-        for para in doc.paragraphs:
-            if para._element == element:
-                return para
-        raise ValueError("Paragraph not found")
+    def _process_paragraph(self, para: Paragraph, text: str) -> dict[str, Any]:
+        """Process a paragraph (with its already-stripped text) into an element dictionary with type, content, level, and num_id for lists."""
 
-    def _find_table(self, doc: docx.document.Document, element: CT_Tbl) -> Table:
-        """Find table object by XML element"""
-        for table in doc.tables:
-            if table._element == element:
-                return table
-        raise ValueError("Table not found")
-
-    def _process_paragraph(self, para: Paragraph) -> dict[str, Any]:
-        """Process a paragraph into an element dictionary with type, content, level, and num_id for lists."""
-        text = para.text.strip()
+        style_name = self._style_name(para._p)
 
         # Heading (styled) - always takes precedence
-        if para.style.name.startswith('Heading'):
-            level_str = para.style.name.replace('Heading', '').strip() or '1'
+        if style_name.startswith('Heading'):
+            level_str = style_name.replace('Heading', '').strip() or '1'
             heading_level = int(level_str)
             self.current_heading_level = heading_level  # Update current heading level
             return {
@@ -383,7 +470,7 @@ class DocxParser:
             }
 
         # Fallback: Style-based list detection
-        style_name_lower = para.style.name.lower()
+        style_name_lower = style_name.lower()
         if 'list' in style_name_lower or 'bullet' in style_name_lower or 'number' in style_name_lower:
             return {
                 "type": "list_item",
@@ -393,8 +480,7 @@ class DocxParser:
             }
 
         # Fallback: Text-based list detection
-        if text.startswith(('- ', '• ', '* ')) or \
-           (text.split('.', 1)[0].isdigit() and len(text.split('.', 1)[0]) < 3 and '.' in text):
+        if self.TEXT_LIST_MARKER_RE.match(text):
             return {
                 "type": "list_item",
                 "level": 0,  # Default ilvl if unknown
@@ -414,25 +500,29 @@ class DocxParser:
         Process a table into an element dictionary.
         The first row is assumed to be the header.
         Subsequent rows are stored individually.
+
+        Rows and cells are read straight from the ``w:tr``/``w:tc`` XML
+        elements rather than through python-docx's ``_Row``/``_Cell`` and
+        ``Paragraph`` wrappers, which are rebuilt on every property access.
         """
-        header_cells: list[str] = []
-        data_rows_content: list[list[str]] = []
-
-        if table.rows:
-            first_row_cells = table.rows[0].cells
-            for cell in first_row_cells:
-                cell_para_texts = [p.text.strip() for p in cell.paragraphs if p.text.strip()]
-                header_cells.append(" ".join(cell_para_texts))
-
-            # Process subsequent rows as data rows
-            for i in range(1, len(table.rows)):
-                row = table.rows[i]
-                current_row_cells_text: list[str] = []
-                for cell in row.cells:
-                    cell_para_texts = [p.text.strip() for p in cell.paragraphs if p.text.strip()]
-                    current_row_cells_text.append(" ".join(cell_para_texts))
-                if any(current_row_cells_text): # Add row only if it has some content
-                    data_rows_content.append(current_row_cells_text)
+        rows = table._tbl.tr_lst
+        if self._table_has_merged_cells(table._tbl):
+            # Text per content-holding cell, so a vertically merged cell spanning
+            # many rows is extracted once rather than once per covered row.
+            cell_texts: dict[CT_Tc, str] = {}
+            read_row = partial(
+                self._row_cell_texts,
+                cell_texts=cell_texts,
+                merge_roots=self._vertical_merge_roots(rows),
+            )
+        else:
+            read_row = self._unmerged_row_cell_texts
+        header_cells = read_row(rows[0]) if rows else []
+
+        if self.stream_tables:
+            data_rows: Any = partial(self._iter_data_rows, rows, read_row)
+        else:
+            data_rows = list(self._iter_data_rows(rows, read_row))
 
         # The 'content' field is removed in favor of structured header/rows.
         # If a single string representation is still needed elsewhere, 
@@ -440,8 +530,81 @@ class DocxParser:
         return {
             "type": "table",
             "level": self.current_heading_level if self.current_heading_level > 0 else 0,
-            "num_rows": len(table.rows), # Total rows including potential header
-            "num_cols": len(table.columns) if table.columns else 0,
+            "num_rows": len(rows), # Total rows including potential header
+            "num_cols": len(table.columns),
             "header": header_cells,
-            "data_rows": data_rows_content # List of lists, where each inner list contains cell strings for a data row
+            "data_rows": data_rows # List of lists (or a factory yielding them when streaming tables), where each inner list contains cell strings for a data row
         }
+
+    @staticmethod
+    def _table_has_merged_cells(tbl) -> bool:
+        """True if any cell of the table is part of a vertical or horizontal merge.
+
+        A single XPath probe evaluated by lxml; nested tables are not
+        considered since only this table's own ``w:tc`` children are read.
+        """
+        return _xpath("boolean(w:tr/w:tc/w:tcPr[w:vMerge or w:gridSpan/@w:val > 1])")(tbl)
+
+    @staticmethod
+    def _iter_data_rows(rows: list[CT_Row], read_row: Callable[[CT_Row], list[str]]) -> Iterator[list[str]]:
+        """Yield the cell strings of each non-empty data row (all rows after the header)."""
+        for tr in rows[1:]:
+            current_row_cells_text = read_row(tr)
+            if any(current_row_cells_text): # Add row only if it has some content
+                yield current_row_cells_text
+
+    @staticmethod
+    def _vertical_merge_roots(rows: list[CT_Row]) -> dict[CT_Tc, CT_Tc]:
+        """Map each vertical-merge continuation cell to the cell starting the merge.
+
+        One pass over the table, carrying the content-holding cell at each
+        layout-grid offset from the row above. python-docx's ``_tc_above``
+        instead recomputes grid offsets from the preceding siblings and
+        rescans the row above for every continuation cell. A continuation
+        cell with nothing above it maps to nothing and is read as-is.
+        """
+        merge_roots: dict[CT_Tc, CT_Tc] = {}
+        roots_above: dict[int, CT_Tc] = {}
+        for tr in rows:
+            roots_in_row: dict[int, CT_Tc] = {}
+            # Read through XPath: CT_Row.grid_before needs python-docx>=1.0.
+            # number() is NaN for a row without w:gridBefore.
+            grid_before = _xpath("number(w:trPr/w:gridBefore/@w:val)")(tr)
+            grid_offset = 0 if math.isnan(grid_before) else int(grid_before)
+            for tc in tr.tc_lst:
+                root = tc
+                if tc.vMerge == "continue" and grid_offset in roots_above:
+                    root = merge_roots[tc] = roots_above[grid_offset]
+                roots_in_row[grid_offset] = root
+                grid_offset += tc.grid_span
+            roots_above = roots_in_row
+        return merge_roots
+
+    def _row_cell_texts(self, tr: CT_Row, cell_texts: dict[CT_Tc, str], merge_roots: dict[CT_Tc, CT_Tc]) -> list[str]:
+        """Cell strings of a row, one per layout-grid column it covers.
+
+        Mirrors python-docx's ``_Row.cells``: a horizontally merged cell
+        (``gridSpan``) repeats its text for every column it spans, and a
+        vertical-merge continuation cell takes the text of the cell that
+        starts the merge (resolved via ``merge_roots``, see
+        :meth:`_vertical_merge_roots`). ``cell_texts`` memoizes the text per
+        resolved cell.
+        """
+        texts: list[str] = []
+        for tc in tr.tc_lst:
+            tc = merge_roots.get(tc, tc)
+            text = cell_texts.get(tc)
+            if text is None:
+                text = cell_texts[tc] = self._cell_text(tc)
+            texts.extend([text] * tc.grid_span)
+        return texts
+
+    def _unmerged_row_cell_texts(self, tr: CT_Row) -> list[str]:
+        """Cell strings of a row in a table without merged cells (one per ``w:tc``)."""
+        return [self._cell_text(tc) for tc in tr.tc_lst]
+
+    @staticmethod
+    def _cell_text(tc: CT_Tc) -> str:
+        """Join the non-empty paragraph texts of a table cell with spaces."""
+        cell_para_texts = [text for p in tc.p_lst if (text := _paragraph_text(p).strip())]
+        return " ".join(cell_para_texts)
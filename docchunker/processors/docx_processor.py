@@ -7,9 +7,9 @@ from docchunker.processors.docx_parser import DocxParser
 
 class DocxProcessor(BaseProcessor):
     """Main processor that orchestrates parsing and chunking"""
-    def __init__(self, chunk_size: int = 1000, num_overlapping_elements: int = 0, min_chunk_size: int | None = None):
+    def __init__(self, chunk_size: int = 1000, num_overlapping_elements: int = 0, min_chunk_size: int | None = None, stream_tables: bool = False):
         super().__init__(chunk_size=chunk_size, num_overlapping_elements=num_overlapping_elements, min_chunk_size=min_chunk_size)
-        self.parser = DocxParser()
+        self.parser = DocxParser(stream_tables=stream_tables)
         self.chunker = DocumentChunker(chunk_size, num_overlapping_elements=num_overlapping_elements, min_chunk_size=min_chunk_size)
 
     def process(self, file_input: str | BinaryIO) -> list[Chunk]:
@@ -6,18 +6,42 @@ from PDF text and formatting information, returning the same hierarchical format
 Uses PyMuPDF (fitz) for rich formatting extraction with fallback to PyPDF.
 """
 
-from typing import Any, Union, BinaryIO, Optional
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Union, BinaryIO, Iterator, Optional
+import copy
+import hashlib
+import io
+import math
+import mmap
+import os
 import re
 import statistics
+import sys
+import threading
 
 # Try PyMuPDF first for rich formatting, fallback to PyPDF
 try:
     import fitz  # PyMuPDF
     HAS_PYMUPDF = True
+    # get_text("dict") flags without image blocks: only text is used, and
+    # leaving images out spares MuPDF from copying their pixel data.
+    _TEXT_DICT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
 except ImportError:
     HAS_PYMUPDF = False
 
-from pypdf import PdfReader
+# Font-size-to-body ratios at which a heading reaches levels 4, 3, 2 and 1;
+# smaller headings are level 5.
+_HEADING_RATIO_THRESHOLDS = (1.2, 1.4, 1.6, 2.0)
+
+# PyMuPDF span flag bits.
+_SPAN_FLAG_ITALIC = 1 << 1
+_SPAN_FLAG_BOLD = 1 << 4
+
+# Hierarchy node types that are closed by any following heading, paragraph or table.
+_LIST_NODE_TYPES = frozenset({'list_container', 'list_item'})
 
 # Whitespace-like characters PDF exporters insert around list markers
 # (regular whitespace plus zero-width/non-breaking characters such as U+200B).
@@ -26,6 +50,43 @@ _MARKER_WS = "\\s\u200b\u200e\u200f\u00a0\ufeff"
 _BULLET_CHARS = "\u2022\u25cf\u25cb\u25aa\u25ab\u25e6\u2023\u25b8\u25b6\u25ba\u2043*\u2013\\-"
 BULLET_ITEM_RE = re.compile(rf"^[{_MARKER_WS}]*[{_BULLET_CHARS}][{_MARKER_WS}]+(\S.*)$")
 NUMBERED_ITEM_RE = re.compile(rf"^[{_MARKER_WS}]*\d{{1,3}}[.)][{_MARKER_WS}]+(\S.*)$")
+# Either of the above in one pattern, so non-list lines fail a single match.
+_LINE_MARKER_RE = re.compile(
+    rf"^[{_MARKER_WS}]*(?:[{_BULLET_CHARS}]|\d{{1,3}}[.)])[{_MARKER_WS}]+(\S.*)$"
+)
+# Non-whitespace, non-digit characters a marker line can start with: the
+# bullets and the zero-width/non-breaking characters of the classes above.
+_LINE_MARKER_FIRST_CHARS = frozenset(
+    "\u2022\u25cf\u25cb\u25aa\u25ab\u25e6\u2023\u25b8\u25b6\u25ba\u2043*\u2013-"
+    "\u200b\u200e\u200f\u00a0\ufeff"
+)
+
+# Patterns of the PyPDF fallback path, compiled once instead of on every line.
+_NUMBERED_SECTION_RE = re.compile(r'^\d+\.\d*\s')  # "1.1 ", "2. "
+_TITLE_CASE_LINE_RE = re.compile(r'^[A-Z]\w*\s+\w+')
+_TABLE_COLUMN_SPLIT_RE = re.compile(r'\s{3,}|\t+')
+# A bullet or numbered list item, matched against the left-stripped line;
+# ``bullet`` is set only for bullet markers. The branches do not overlap and
+# the content must start with a non-space, so no two quantifiers compete for
+# the same characters and matching stays linear in the line length. Letter
+# cases are spelled out rather than using re.IGNORECASE, whose Unicode case
+# folding would also accept e.g. the Kelvin sign or a dotted capital I.
+_LIST_ITEM_RE = re.compile(
+    r'(?:(?P<bullet>[-•*▪▫►▶])'  # - • * ▪ ▫ ► ▶
+    r'|\d+[.)]'                  # 1. 2. 3. / 1) 2) 3)
+    r'|\(\d+\)'                  # (1) (2) (3)
+    r'|[a-hj-uwyzA-HJ-UWYZ]\.'   # a. b. c. / A. B. C. (letters other than i, v, x)
+    r'|[ivxIVX]+\.)'             # i. ii. iii. / I. II. III. (roman numerals)
+    r'\s+(?P<content>\S.*)$'
+)
+
+# Flat (pre-hierarchy) elements of recently parsed PDF documents, most
+# recently used last, so re-indexing an unchanged document skips extraction.
+_FLAT_ELEMENTS_CACHE: "OrderedDict[tuple, list[dict[str, Any]]]" = OrderedDict()
+_FLAT_ELEMENTS_CACHE_SIZE = 32
+# Guards the cache's lookup/reorder and insert/evict steps, which are not
+# atomic; parsing itself runs outside the lock.
+_FLAT_ELEMENTS_CACHE_LOCK = threading.Lock()
 
 
 class PdfParser:
@@ -50,19 +111,100 @@ class PdfParser:
     
     def _apply_with_pymupdf(self, file_input: Union[str, BinaryIO]) -> list[dict[str, Any]]:
         """Parse PDF using PyMuPDF for rich formatting extraction."""
-        # Open document with PyMuPDF
         if isinstance(file_input, str):
-            doc = fitz.open(file_input)
+            # A file on disk is identified by its path; rewriting it changes
+            # its modification time or size
+            stat = os.stat(file_input)
+            key = (os.path.abspath(file_input), stat.st_mtime_ns, stat.st_size)
+            flat_elements = self._cached_flat_elements(key, partial(fitz.open, file_input))
+        elif hasattr(file_input, 'read'):
+            # Open from memory; in-memory documents are identified by their
+            # content
+            with self._stream_contents(file_input) as content:
+                key = hashlib.blake2b(content, digest_size=16).digest()
+                flat_elements = self._cached_flat_elements(
+                    key, partial(self._open_pdf_stream, content))
         else:
-            # For BytesIO, read content and open from memory
-            if hasattr(file_input, 'read'):
-                content = file_input.read()
-                if hasattr(file_input, 'seek'):
-                    file_input.seek(0)  # Reset for potential future use
-                doc = fitz.open(stream=content, filetype="pdf")
-            else:
-                raise ValueError("Unsupported file input type for PyMuPDF")
-        
+            raise ValueError("Unsupported file input type for PyMuPDF")
+
+        # Reconstruct hierarchy
+        hierarchical_elements = self._reconstruct_hierarchy(flat_elements)
+        return hierarchical_elements
+
+    @staticmethod
+    @contextmanager
+    def _stream_contents(file_input: BinaryIO) -> Iterator[Union[bytes, memoryview]]:
+        """Yield the rest of a file-like object's content, copying it only if needed.
+
+        A BytesIO buffer is viewed in place and a regular file is memory-mapped,
+        so large PDFs are not duplicated into a bytes object; other streams
+        are read and rewound. Views are released on exit, so they must not be
+        used afterwards.
+        """
+        if isinstance(file_input, io.BytesIO):
+            with file_input.getbuffer() as buffer, buffer[file_input.tell():] as content:
+                yield content
+            return
+
+        try:
+            mapped = mmap.mmap(file_input.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # No file descriptor (io.UnsupportedOperation is both an OSError
+            # and a ValueError), a pipe, or an empty file
+            content = file_input.read()
+            if hasattr(file_input, 'seek'):
+                file_input.seek(0)  # Reset for potential future use
+            yield content
+            return
+
+        try:
+            with memoryview(mapped) as buffer, buffer[file_input.tell():] as content:
+                yield content
+        finally:
+            mapped.close()
+
+    @staticmethod
+    def _open_pdf_stream(content: Union[bytes, memoryview]):
+        """Open a PDF from in-memory content with PyMuPDF.
+
+        Older PyMuPDF releases (1.23.x) accept only bytes, bytearray and BytesIO
+        streams and raise TypeError for a memoryview; the view is then copied
+        to bytes.
+        """
+        try:
+            return fitz.open(stream=content, filetype="pdf")
+        except TypeError:
+            if isinstance(content, bytes):
+                raise
+            return fitz.open(stream=bytes(content), filetype="pdf")
+
+    def _cached_flat_elements(self, document_key: Any, open_document) -> list[dict[str, Any]]:
+        """Return a document's flat elements, reusing an earlier parse.
+
+        ``document_key`` identifies the document (see ``_apply_with_pymupdf``)
+        and is combined with the heading threshold, the only setting that
+        changes the result. ``open_document`` opens it on a cache miss.
+        """
+        key = (document_key, self.heading_font_threshold)
+        with _FLAT_ELEMENTS_CACHE_LOCK:
+            flat_elements = _FLAT_ELEMENTS_CACHE.get(key)
+            if flat_elements is not None:
+                _FLAT_ELEMENTS_CACHE.move_to_end(key)
+        if flat_elements is None:
+            flat_elements = self._extract_flat_elements_with_pymupdf(open_document())
+            with _FLAT_ELEMENTS_CACHE_LOCK:
+                _FLAT_ELEMENTS_CACHE[key] = flat_elements
+                if len(_FLAT_ELEMENTS_CACHE) > _FLAT_ELEMENTS_CACHE_SIZE:
+                    _FLAT_ELEMENTS_CACHE.popitem(last=False)
+        # The hierarchy is built by nesting these dicts in place, and callers
+        # own what they get back, so never hand out the cached ones.
+        return copy.deepcopy(flat_elements)
+
+    def _extract_flat_elements_with_pymupdf(self, doc) -> list[dict[str, Any]]:
+        """Extract an open document's elements in reading order, before nesting.
+
+        The document is closed once its pages are read.
+        """
         self.current_heading_level = 0
 
         # Collect tables (via PyMuPDF's geometric table detection) and text
@@ -70,17 +212,25 @@ class PdfParser:
         # fall inside a detected table region are excluded from the normal
         # paragraph/heading flow.
         ordered_items = []
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            tables = self._extract_tables(page)
-            table_bboxes = [t['bbox'] for t in tables]
-            page_items = [{'y': b['y'], 'block': b}
-                          for b in self._extract_blocks_with_pymupdf(page, table_bboxes)]
-            page_items += [{'y': t['bbox'][1], 'table': t} for t in tables]
-            page_items.sort(key=lambda item: item['y'])
-            ordered_items.extend(page_items)
-
-        doc.close()
+        # Closed even on errors: an in-memory document may be backed by a
+        # memory map that is unmapped once parsing returns.
+        with doc:
+            for page_num in range(doc.page_count):
+                page = doc[page_num]
+                # Text blocks only (images are left out inside MuPDF). A page with
+                # no text at all (scans, figures) has nothing to extract, so it
+                # skips table detection, by far the costliest step per page.
+                text_blocks = [block for block in page.get_text("dict", flags=_TEXT_DICT_FLAGS)["blocks"]
+                               if "lines" in block]
+                if not text_blocks:
+                    continue
+                tables = self._extract_tables(page)
+                table_bboxes = [t['bbox'] for t in tables]
+                page_items = [{'y': b['y'], 'block': b}
+                              for b in self._extract_blocks_with_pymupdf(text_blocks, table_bboxes)]
+                page_items += [{'y': t['bbox'][1], 'table': t} for t in tables]
+                page_items.sort(key=lambda item: item['y'])
+                ordered_items.extend(page_items)
 
         # Document-wide statistics: font sizes (for heading detection and
         # per-document heading level normalization) and list indentation tiers.
@@ -107,9 +257,7 @@ class PdfParser:
             if element:
                 flat_elements.append(element)
 
-        # Reconstruct hierarchy
-        hierarchical_elements = self._reconstruct_hierarchy(flat_elements)
-        return hierarchical_elements
+        return flat_elements
 
     def _extract_tables(self, page) -> list[dict[str, Any]]:
         """Detect tables on a page using PyMuPDF's geometric table finder.
@@ -174,27 +322,38 @@ class PdfParser:
     
     def _apply_with_pypdf(self, file_input: Union[str, BinaryIO]) -> list[dict[str, Any]]:
         """Parse PDF using PyPDF with enhanced heuristics (fallback method)."""
+        # Imported on first use: with PyMuPDF installed the fallback rarely
+        # runs, and pypdf takes about as long to import as the rest of the
+        # package
+        from pypdf import PdfReader
+
         reader = PdfReader(file_input)
         flat_elements = []
         self.current_heading_level = 0
         
-        # Extract text with enhanced heuristics
-        all_text_blocks = []
+        # Extract text with enhanced heuristics into parallel text/font-size
+        # lists, accumulating the font-size total page by page
+        block_texts: list[str] = []
+        block_font_sizes: list[float] = []
+        font_size_total = 0.0
+        font_size_count = 0
         for page in reader.pages:
-            page_text_blocks = self._extract_text_blocks_enhanced_heuristics(page)
-            all_text_blocks.extend(page_text_blocks)
+            page_texts, page_font_sizes = self._extract_text_blocks_enhanced_heuristics(page)
+            block_texts.extend(page_texts)
+            block_font_sizes.extend(page_font_sizes)
+            font_size_total += sum(page_font_sizes)
+            font_size_count += len(page_font_sizes) - page_font_sizes.count(0)
         
-        # Calculate average font size for heading detection
-        font_sizes = [block['font_size'] for block in all_text_blocks if block['font_size']]
-        avg_font_size = sum(font_sizes) / len(font_sizes) if font_sizes else 12
+        # Average font size for heading detection (unknown sizes excluded)
+        avg_font_size = font_size_total / font_size_count if font_size_count else 12
         
         # Process text blocks into structured elements
-        for block in all_text_blocks:
-            text = block['text'].strip()
+        for text, font_size in zip(block_texts, block_font_sizes):
+            text = text.strip()
             if not text:
                 continue
                 
-            element = self._process_text_block(block, avg_font_size)
+            element = self._process_text_block(text, font_size, avg_font_size)
             if element:
                 flat_elements.append(element)
         
@@ -202,25 +361,22 @@ class PdfParser:
         hierarchical_elements = self._reconstruct_hierarchy(flat_elements)
         return hierarchical_elements
     
-    def _extract_blocks_with_pymupdf(self, page, exclude_bboxes=()) -> list[dict[str, Any]]:
-        """Extract text blocks with rich formatting using PyMuPDF.
+    def _extract_blocks_with_pymupdf(self, text_blocks: list[dict[str, Any]], exclude_bboxes=()) -> list[dict[str, Any]]:
+        """Extract text blocks with rich formatting from a page's PyMuPDF text blocks.
 
+        ``text_blocks`` are the text blocks of ``page.get_text("dict")``.
         Lines whose center falls inside one of ``exclude_bboxes`` (detected
         table regions) are skipped so table text does not leak into the
         paragraph/heading flow.
         """
         blocks = []
 
-        # Get text dictionary with detailed formatting
-        text_dict = page.get_text("dict")
-
-        for block in text_dict.get("blocks", []):
-            # Skip image blocks
-            if "lines" not in block:
-                continue
-
-            lines = [line for line in block["lines"]
-                     if not self._line_in_bboxes(line.get("bbox"), exclude_bboxes)]
+        for block in text_blocks:
+            # Most pages have no tables, and then every line is kept as is
+            lines = block["lines"]
+            if exclude_bboxes:
+                lines = [line for line in lines
+                         if not self._line_in_bboxes(line.get("bbox"), exclude_bboxes)]
 
             # Group lines into paragraphs based on spatial and formatting analysis
             paragraphs = self._group_lines_into_paragraphs(lines)
@@ -230,51 +386,62 @@ class PdfParser:
                     continue
                     
                 # Combine all lines in the paragraph
-                paragraph_text = ""
-                all_fonts = []
+                line_texts = []
+                font_counts = Counter()
                 all_sizes = []
-                all_flags = []
-                paragraph_bbox = None
+                combined_flags = 0
+                # Paragraph bounding box, grown line by line
+                x0, y0, x1, y1 = paragraph_lines[0]['bbox']
                 
                 for line_data in paragraph_lines:
-                    line_text = line_data['text']
-                    paragraph_text += line_text + " "
-                    all_fonts.extend(line_data['fonts'])
+                    line_texts.append(line_data['text'])
+                    font_counts.update(line_data['font_counts'])
                     all_sizes.extend(line_data['sizes'])
-                    all_flags.extend(line_data['flags'])
+                    combined_flags |= line_data['flags']
                     
-                    # Update paragraph bounding box
-                    if paragraph_bbox is None:
-                        paragraph_bbox = line_data['bbox']
-                    else:
-                        # Expand bbox to include this line
-                        paragraph_bbox = [
-                            min(paragraph_bbox[0], line_data['bbox'][0]),  # min x
-                            min(paragraph_bbox[1], line_data['bbox'][1]),  # min y
-                            max(paragraph_bbox[2], line_data['bbox'][2]),  # max x
-                            max(paragraph_bbox[3], line_data['bbox'][3])   # max y
-                        ]
+                    line_x0, line_y0, line_x1, line_y1 = line_data['bbox']
+                    if line_x0 < x0:
+                        x0 = line_x0
+                    if line_y0 < y0:
+                        y0 = line_y0
+                    if line_x1 > x1:
+                        x1 = line_x1
+                    if line_y1 > y1:
+                        y1 = line_y1
                 
-                if paragraph_text.strip():
+                # Line texts are stripped and non-empty
+                paragraph_text = " ".join(line_texts)
+                if paragraph_text:
                     # Calculate paragraph-level formatting
-                    avg_size = statistics.mean(all_sizes) if all_sizes else 12
-                    is_bold = any(flags & 2**4 for flags in all_flags)  # Bold flag
-                    is_italic = any(flags & 2**1 for flags in all_flags)  # Italic flag
-                    font_family = max(set(all_fonts), key=all_fonts.count) if all_fonts else ""
+                    avg_size = math.fsum(all_sizes) / len(all_sizes) if all_sizes else 12
+                    is_bold = bool(combined_flags & _SPAN_FLAG_BOLD)
+                    is_italic = bool(combined_flags & _SPAN_FLAG_ITALIC)
+                    font_family = self._dominant_font(font_counts)
                     
                     blocks.append({
-                        'text': paragraph_text.strip(),
+                        'text': paragraph_text,
                         'font_size': avg_size,
                         'font_family': font_family,
                         'is_bold': is_bold,
                         'is_italic': is_italic,
-                        'x': paragraph_bbox[0] if paragraph_bbox else 0,
-                        'y': paragraph_bbox[1] if paragraph_bbox else 0,
-                        'bbox': paragraph_bbox if paragraph_bbox else [0, 0, 0, 0]
+                        'x': x0,
+                        'y': y0,
+                        'bbox': [x0, y0, x1, y1]
                     })
         
         return blocks
     
+    @staticmethod
+    def _dominant_font(font_counts: dict[str, int]) -> str:
+        """Return the most used font in ``font_counts``, or "" if it is empty.
+
+        Ties go to the font seen first (``max`` keeps the first maximum).
+        """
+        if len(font_counts) == 1:
+            # Most lines and paragraphs use a single font: nothing to compare
+            return next(iter(font_counts))
+        return max(font_counts, key=font_counts.get) if font_counts else ""
+
     def _group_lines_into_paragraphs(self, lines: list) -> list[list[dict[str, Any]]]:
         """Group lines into paragraphs based on spatial relationships and formatting consistency."""
         if not lines:
@@ -283,29 +450,34 @@ class PdfParser:
         # First, extract line data with formatting information
         processed_lines = []
         for line in lines:
-            line_text = ""
-            line_fonts = []
+            span_texts = []
+            font_counts = {}  # font name -> span count, in first-seen order
             line_sizes = []
-            line_flags = []
+            line_flags = 0  # OR of the span flags
             
             for span in line.get("spans", []):
                 span_text = span.get("text", "")
                 if span_text.strip():
-                    line_text += span_text
-                    line_fonts.append(span.get("font", ""))
+                    span_texts.append(span_text)
+                    # MuPDF returns a fresh string per span; interned, the
+                    # handful of font names per document are shared and the
+                    # line-to-line font comparison hits the identity check
+                    font = sys.intern(span.get("font", ""))
+                    font_counts[font] = font_counts.get(font, 0) + 1
                     line_sizes.append(span.get("size", 12))
-                    line_flags.append(span.get("flags", 0))
+                    line_flags |= span.get("flags", 0)
             
-            if line_text.strip():
+            line_text = "".join(span_texts).strip()
+            if line_text:
                 processed_lines.append({
-                    'text': line_text.strip(),
-                    'fonts': line_fonts,
+                    'text': line_text,
+                    'font_counts': font_counts,
                     'sizes': line_sizes,
                     'flags': line_flags,
                     'bbox': line.get("bbox", [0, 0, 0, 0]),
-                    'avg_size': statistics.mean(line_sizes) if line_sizes else 12,
-                    'is_bold': any(flags & 2**4 for flags in line_flags),
-                    'font_family': max(set(line_fonts), key=line_fonts.count) if line_fonts else ""
+                    'avg_size': math.fsum(line_sizes) / len(line_sizes) if line_sizes else 12,
+                    'is_bold': bool(line_flags & _SPAN_FLAG_BOLD),
+                    'font_family': self._dominant_font(font_counts)
                 })
         
         if not processed_lines:
@@ -370,25 +542,14 @@ class PdfParser:
         if not prev_text or not curr_text:
             return False
         
-        # Lines ending with sentence punctuation often end paragraphs
-        if prev_text.endswith(('.', '!', '?')):
-            # But check if next line looks like a continuation
-            # (starts with lowercase, doesn't look like a heading)
-            if (curr_text and curr_text[0].islower() and 
-                not curr_text.endswith(':') and
-                len(curr_text) > 20):  # Reasonably long line, not likely a heading
-                return True
-            return False
-        
-        # Lines ending with commas, semicolons, or no punctuation likely continue
-        if prev_text.endswith((',', ';', ':')) or not prev_text[-1] in '.!?':
-            return True
-        
-        # Check if current line starts with lowercase (likely continuation)
-        if curr_text and curr_text[0].islower():
-            return True
-        
-        # Default to continuation if no clear break indicators
+        # Lines ending with sentence punctuation often end paragraphs, unless
+        # the next line looks like a continuation (starts with lowercase,
+        # doesn't look like a heading, and is reasonably long). Any other
+        # ending - a comma, semicolon, colon or no punctuation - continues.
+        if prev_text[-1] in '.!?':
+            return (curr_text[0].islower() and
+                    curr_text[-1] != ':' and
+                    len(curr_text) > 20)
         return True
     
     def _calculate_font_statistics(self, blocks: list[dict[str, Any]]) -> dict[str, Any]:
@@ -398,11 +559,13 @@ class PdfParser:
         if not font_sizes:
             return {'avg_size': 12, 'median_size': 12, 'std_size': 0}
         
-        avg_size = statistics.mean(font_sizes)
+        # math.fsum is exactly rounded like statistics.mean, without its
+        # per-value Fraction arithmetic; stdev reuses the mean.
+        avg_size = math.fsum(font_sizes) / len(font_sizes)
         median_size = statistics.median(font_sizes)
         
         if len(font_sizes) > 1:
-            std_size = statistics.stdev(font_sizes)
+            std_size = statistics.stdev(font_sizes, xbar=avg_size)
         else:
             std_size = 0
             
@@ -421,11 +584,13 @@ class PdfParser:
         tolerating zero-width/non-breaking characters around the marker as
         emitted by common PDF exporters. Returns None for non-list lines.
         """
-        for pattern in (BULLET_ITEM_RE, NUMBERED_ITEM_RE):
-            match = pattern.match(text)
-            if match:
-                return match.group(1).strip()
-        return None
+        # Most lines start with a letter and can be rejected on their first
+        # character; \s and \d match exactly isspace() and isdecimal()
+        first = text[:1]
+        if not (first in _LINE_MARKER_FIRST_CHARS or first.isspace() or first.isdecimal()):
+            return None
+        match = _LINE_MARKER_RE.match(text)
+        return match.group(1).strip() if match else None
 
     def _compute_indent_tiers(self, blocks: list[dict[str, Any]]) -> list[float]:
         """Cluster the x-positions of list-marker lines into indentation tiers.
@@ -451,7 +616,7 @@ class PdfParser:
         """Map heading font sizes to normalized levels (largest size -> 1)."""
         heading_sizes = sorted(
             {round(block.get('font_size', 12), 1) for block in blocks
-             if block.get('text', '').strip() and self._is_heading_with_formatting(block, font_stats)},
+             if self._is_heading_with_formatting(block, font_stats)},
             reverse=True,
         )
         return {size: min(idx + 1, 6) for idx, size in enumerate(heading_sizes)}
@@ -475,7 +640,10 @@ class PdfParser:
                 "num_id": -1,
             }
 
-        if self._is_heading_with_formatting(block, font_stats):
+        # The marker check above already ruled out a list item, so go
+        # straight to the formatting test instead of re-stripping the text
+        # and re-running the marker regex in _is_heading_with_formatting.
+        if self._has_heading_formatting(text, block, font_stats):
             heading_level = self._determine_heading_level_advanced(block, font_stats)
             self.current_heading_level = heading_level
             return {
@@ -502,7 +670,14 @@ class PdfParser:
         text = block['text'].strip()
         if not text or self._detect_line_marker(text) is not None:
             return False
+        return self._has_heading_formatting(text, block, font_stats)
 
+    def _has_heading_formatting(self, text: str, block: dict[str, Any], font_stats: dict[str, Any]) -> bool:
+        """Font-size and boldness test of ``_is_heading_with_formatting``.
+
+        ``text`` is the block's stripped, non-empty text, already known not
+        to start with a list marker.
+        """
         font_size = block.get('font_size', 12)
         body_size = font_stats.get('median_size') or font_stats.get('avg_size', 12)
 
@@ -512,7 +687,7 @@ class PdfParser:
         return (
             bool(block.get('is_bold'))
             and len(text) < 100
-            and not text.endswith(('.', '!', '?', ':', ';', ','))
+            and text[-1] not in '.!?:;,'
         )
 
     def _determine_heading_level_advanced(self, block: dict[str, Any], font_stats: dict[str, Any]) -> int:
@@ -529,9 +704,74 @@ class PdfParser:
         return self._determine_heading_level(font_size, font_stats.get('avg_size', 12))
 
 
-    def _extract_text_blocks_enhanced_heuristics(self, page) -> list[dict[str, Any]]:
-        """Extract text blocks with enhanced heuristics (PyPDF fallback method)."""
-        text_blocks = []
+    @staticmethod
+    def _split_paragraphs(text: str) -> list[str]:
+        """Split page text at paragraph breaks.
+
+        A break is a blank line (the whole whitespace run up to its last
+        newline is dropped), or a single newline followed, after optional
+        whitespace, by a "Label:" line (a capital letter with a colon before
+        any period) or a "1." numbered line. Equivalent to splitting on
+        ``\\n\\s*\\n|\\n(?=\\s*[A-Z][^.]*:)|\\n(?=\\s*\\d+\\.)``, whose
+        lookahead rescanned the rest of the page after every newline; here
+        the next colon and period are tracked forward, keeping it linear.
+        """
+        pieces = []
+        start = 0
+        length = len(text)
+        # Next ':' and '.' after the current line start (length if none)
+        colon = dot = -1
+        newline = text.find('\n')
+        while newline != -1:
+            after = newline + 1
+            run_end = after
+            last_newline = -1
+            while run_end < length and text[run_end].isspace():
+                if text[run_end] == '\n':
+                    last_newline = run_end
+                run_end += 1
+
+            if last_newline != -1:
+                pieces.append(text[start:newline])
+                start = last_newline + 1
+                newline = text.find('\n', start)
+                continue
+
+            is_break = False
+            if run_end < length:
+                first = text[run_end]
+                if 'A' <= first <= 'Z':
+                    if colon <= run_end:
+                        colon = text.find(':', run_end + 1)
+                        if colon == -1:
+                            colon = length
+                    if dot <= run_end:
+                        dot = text.find('.', run_end + 1)
+                        if dot == -1:
+                            dot = length
+                    is_break = colon < dot
+                elif first.isdecimal():
+                    digits_end = run_end + 1
+                    while digits_end < length and text[digits_end].isdecimal():
+                        digits_end += 1
+                    is_break = digits_end < length and text[digits_end] == '.'
+
+            if is_break:
+                pieces.append(text[start:newline])
+                start = after
+            newline = text.find('\n', after)
+
+        pieces.append(text[start:])
+        return pieces
+
+    def _extract_text_blocks_enhanced_heuristics(self, page) -> tuple[list[str], list[float]]:
+        """Extract text blocks with enhanced heuristics (PyPDF fallback method).
+
+        Returns the block texts and their estimated font sizes as two parallel
+        lists; PyPDF gives no positions, so none are recorded.
+        """
+        texts: list[str] = []
+        font_sizes: list[float] = []
         
         try:
             # Enhanced text extraction for PyPDF
@@ -539,13 +779,14 @@ class PdfParser:
             
             # Split into paragraphs more intelligently
             # Look for paragraph breaks (double newlines, section breaks)
-            paragraphs = re.split(r'\n\s*\n|\n(?=\s*[A-Z][^.]*:)|\n(?=\s*\d+\.)', full_text)
+            paragraphs = self._split_paragraphs(full_text)
             
             for paragraph in paragraphs:
-                lines = paragraph.strip().split('\n')
                 current_paragraph = []
                 
-                for line in lines:
+                # Lines are stripped (and blank ones skipped) individually,
+                # so the paragraph itself needs no strip first
+                for line in paragraph.splitlines():
                     line = line.strip()
                     if line:
                         # Group lines that likely belong together
@@ -559,13 +800,8 @@ class PdfParser:
                             # Process previous paragraph if any
                             if current_paragraph:
                                 combined_text = ' '.join(current_paragraph)
-                                font_size = self._estimate_font_size(combined_text)
-                                text_blocks.append({
-                                    'text': combined_text,
-                                    'font_size': font_size,
-                                    'x': 0,
-                                    'y': 0
-                                })
+                                texts.append(combined_text)
+                                font_sizes.append(self._estimate_font_size(combined_text))
                             
                             # Start new paragraph
                             current_paragraph = [line]
@@ -573,64 +809,57 @@ class PdfParser:
                 # Don't forget the last paragraph
                 if current_paragraph:
                     combined_text = ' '.join(current_paragraph)
-                    font_size = self._estimate_font_size(combined_text)
-                    text_blocks.append({
-                        'text': combined_text,
-                        'font_size': font_size,
-                        'x': 0,
-                        'y': 0
-                    })
+                    texts.append(combined_text)
+                    font_sizes.append(self._estimate_font_size(combined_text))
                     
         except Exception:
             # Ultimate fallback
-            text_blocks.append({
-                'text': page.extract_text() or "",
-                'font_size': 12,
-                'x': 0,
-                'y': 0
-            })
+            texts.append(page.extract_text() or "")
+            font_sizes.append(12)
             
-        return text_blocks
+        return texts, font_sizes
     
     def _looks_like_new_section(self, text: str) -> bool:
         """Determine if a line looks like the start of a new section."""
         text = text.strip()
         
-        # Check for common section indicators
-        section_indicators = [
-            text.isupper() and len(text) < 50,  # All caps headings
-            text.endswith(':') and len(text) < 50,  # Headings ending with colon
-            re.match(r'^\d+\.\d*\s', text),  # Numbered sections like "1.1 "
-            re.match(r'^[A-Z]\w*\s+\w+', text) and len(text) < 50,  # Title case short lines
-            text.startswith(('Chapter', 'Section', 'Part', 'Appendix')),  # Explicit sections
-        ]
-        
-        return any(section_indicators)
+        # Short lines: all caps, ending with a colon, or title case. The
+        # length test comes first so long lines skip the character scans.
+        if len(text) < 50 and (text.isupper() or
+                               text.endswith(':') or
+                               _TITLE_CASE_LINE_RE.match(text)):
+            return True
+
+        # Numbered sections like "1.1 " and explicit section words
+        return (_NUMBERED_SECTION_RE.match(text) is not None or
+                text.startswith(('Chapter', 'Section', 'Part', 'Appendix')))
     
-    def _estimate_font_size(self, text: str) -> float:
+    @staticmethod
+    def _estimate_font_size(text: str) -> float:
         """Heuristic to estimate font size based on text characteristics."""
-        # Simple heuristics for heading detection
+        # Simple heuristics for heading detection; every rule needs a short
+        # line, so long paragraphs skip the character scans entirely
+        length = len(text)
+        if length >= 100:
+            return 12
         
         # All caps text might be headings
-        if text.isupper() and len(text) < 100:
+        if text.isupper():
             return 16
             
         # Text ending with colons might be headings
-        if text.endswith(':') and len(text) < 100:
+        if text.endswith(':'):
             return 14
             
         # Short lines might be headings
-        if len(text) < 50 and not text.endswith('.'):
+        if length < 50 and not text.endswith('.'):
             return 13
             
         # Default paragraph size
         return 12
     
-    def _process_text_block(self, block: dict[str, Any], avg_font_size: float) -> dict[str, Any] | None:
-        """Process a text block into a structured element dictionary."""
-        text = block['text'].strip()
-        font_size = block.get('font_size', 12)
-        
+    def _process_text_block(self, text: str, font_size: float, avg_font_size: float) -> dict[str, Any] | None:
+        """Process a text block (already stripped by the caller) into a structured element dictionary."""
         if not text:
             return None
             
@@ -654,13 +883,9 @@ class PdfParser:
                 "num_id": list_match['num_id']
             }
         
-        # Table detection (basic - look for multiple columns separated by spaces/tabs)
-        if self._is_table_row(text):
-            # For now, treat table rows as paragraphs
-            # TODO: Implement proper table detection and grouping
-            pass
-        
-        # Default to paragraph
+        # Default to paragraph. Column-like lines (see _is_table_row) are kept
+        # as paragraphs too; the PyPDF path does not group table rows yet.
+        # TODO: Implement proper table detection and grouping
         return {
             "type": "paragraph",
             "level": self.current_heading_level if self.current_heading_level > 0 else 0,
@@ -669,84 +894,52 @@ class PdfParser:
     
     def _determine_heading_level(self, font_size: float, avg_font_size: float) -> int:
         """Determine heading level based on font size."""
-        ratio = font_size / avg_font_size
-        
-        if ratio >= 2.0:
-            return 1
-        elif ratio >= 1.6:
-            return 2
-        elif ratio >= 1.4:
-            return 3
-        elif ratio >= 1.2:
-            return 4
-        else:
-            return 5
+        # Each threshold the ratio reaches raises the heading one level
+        return 5 - bisect_right(_HEADING_RATIO_THRESHOLDS, font_size / avg_font_size)
     
     def _detect_list_item(self, text: str) -> dict[str, Any] | None:
         """Detect if text is a list item and extract its properties."""
         
-        # Bullet list patterns
-        bullet_patterns = [
-            r'^[\s]*[-•*▪▫][\s]+(.+)$',  # - • * ▪ ▫
-            r'^[\s]*[►▶][\s]+(.+)$',    # ► ▶
-        ]
-        
-        for pattern in bullet_patterns:
-            match = re.match(pattern, text)
-            if match:
-                indent_level = len(text) - len(text.lstrip())
-                level = indent_level // 4  # Assume 4 spaces per indent level
-                return {
-                    'level': level,
-                    'content': match.group(1).strip(),
-                    'num_id': -1  # Bullet list
-                }
-        
-        # Numbered list patterns
-        numbered_patterns = [
-            r'^[\s]*(\d+)\.[\s]+(.+)$',           # 1. 2. 3.
-            r'^[\s]*(\d+)\)[\s]+(.+)$',           # 1) 2) 3)
-            r'^[\s]*\((\d+)\)[\s]+(.+)$',         # (1) (2) (3)
-            r'^[\s]*([a-z])\.[\s]+(.+)$',         # a. b. c.
-            r'^[\s]*([A-Z])\.[\s]+(.+)$',         # A. B. C.
-            r'^[\s]*([ivx]+)\.[\s]+(.+)$',        # i. ii. iii. (roman numerals)
-        ]
-        
-        for pattern in numbered_patterns:
-            match = re.match(pattern, text, re.IGNORECASE)
-            if match:
-                indent_level = len(text) - len(text.lstrip())
-                level = indent_level // 4
-                return {
-                    'level': level,
-                    'content': match.group(2).strip(),
-                    'num_id': 1  # Numbered list
-                }
-        
-        return None
+        stripped = text.lstrip()
+        match = _LIST_ITEM_RE.match(stripped)
+        if not match:
+            return None
+
+        indent_level = len(text) - len(stripped)
+        return {
+            'level': indent_level // 4,  # Assume 4 spaces per indent level
+            'content': match.group('content').strip(),
+            'num_id': -1 if match.group('bullet') else 1  # Bullet vs numbered list
+        }
     
     def _is_table_row(self, text: str) -> bool:
         """Basic detection of table rows (multiple columns)."""
         # Look for multiple columns separated by multiple spaces or tabs
-        columns = re.split(r'\s{3,}|\t+', text)
+        columns = _TABLE_COLUMN_SPLIT_RE.split(text)
         return len(columns) > 1 and all(col.strip() for col in columns)
     
     def _reconstruct_hierarchy(self, flat_elements: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Reconstructs a hierarchical structure from a flat list of elements.
         This is identical to the DocxParser logic to ensure consistency.
+        The element dicts are turned into nodes in place (a 'children' list is added).
         """
         root_nodes: list[dict[str, Any]] = []
         parent_stack: list[dict[str, Any]] = []
 
-        for element_data in flat_elements:
-            node = {**element_data, 'children': []}
+        for node in flat_elements:
+            node['children'] = []
 
-            if node['type'] == 'heading':
-                while parent_stack and \
-                      ((parent_stack[-1]['type'] == 'heading' and parent_stack[-1]['level'] >= node['level']) or \
-                       (parent_stack[-1]['type'] in ['list_container', 'list_item'])):
-                    parent_stack.pop()
+            node_type = node['type']
+            if node_type == 'heading':
+                heading_level = node['level']
+                while parent_stack:
+                    top = parent_stack[-1]
+                    top_type = top['type']
+                    if top_type in _LIST_NODE_TYPES or (top_type == 'heading' and top['level'] >= heading_level):
+                        parent_stack.pop()
+                    else:
+                        break
 
                 if not parent_stack:
                     root_nodes.append(node)
@@ -754,31 +947,24 @@ class PdfParser:
                     parent_stack[-1]['children'].append(node)
                 parent_stack.append(node)
 
-            elif node['type'] == 'list_item':
+            elif node_type == 'list_item':
                 li_level = node['level']
                 li_num_id = node['num_id']
 
                 while parent_stack:
                     p_on_stack = parent_stack[-1]
-                    if p_on_stack['type'] == 'list_container':
-                        if p_on_stack['num_id'] == li_num_id:
-                            if p_on_stack['level'] == li_level:
-                                break
-                            elif p_on_stack['level'] < li_level:
-                                break
-                            else:
-                                parent_stack.pop()
-                        else:
-                            parent_stack.pop()
-                    elif p_on_stack['type'] == 'list_item':
+                    p_type = p_on_stack['type']
+                    if p_type == 'heading':
+                        break
+                    if p_type == 'list_container':
+                        # Same list at this level or shallower: attach here or below
+                        if p_on_stack['num_id'] == li_num_id and p_on_stack['level'] <= li_level:
+                            break
+                    elif p_type == 'list_item':
+                        # Same list, deeper level: nest under this item
                         if p_on_stack['num_id'] == li_num_id and li_level > p_on_stack['level']:
                             break
-                        else:
-                            parent_stack.pop()
-                    elif p_on_stack['type'] == 'heading':
-                        break
-                    else:
-                        parent_stack.pop()
+                    parent_stack.pop()
 
                 current_parent_on_stack = parent_stack[-1] if parent_stack else None
 
@@ -804,8 +990,8 @@ class PdfParser:
                     parent_stack.append(list_container_node)
                     parent_stack.append(node)
 
-            elif node['type'] in ['paragraph', 'table']:
-                while parent_stack and parent_stack[-1]['type'] in ['list_item', 'list_container']:
+            elif node_type in ('paragraph', 'table'):
+                while parent_stack and parent_stack[-1]['type'] in _LIST_NODE_TYPES:
                     parent_stack.pop()
                 
                 if not parent_stack:
@@ -4,7 +4,6 @@ Text processing utilities for document chunking.
 
 import os
 from pathlib import Path
-import re
 
 
 def get_file_extension(file_path: str | Path) -> str:
@@ -12,9 +11,10 @@ def get_file_extension(file_path: str | Path) -> str:
 
 
 def normalize_whitespace(text: str) -> str:
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'\n+', '\n\n', text)
-    return text.strip()
+    # Every whitespace run (line breaks included) becomes a single space;
+    # str.split() treats exactly the characters regex \s matches as
+    # whitespace and drops the ends, without going through the regex engine
+    return ' '.join(text.split())
 
 
 def extract_keywords(text: str, max_keywords: int = 10) -> list[str]:
@@ -166,6 +166,37 @@ class TestUndersizedParagraphMerging:
         assert all(c.metadata["node_type"] == "paragraph" for c in chunks)
 
 
+class TestParagraphOverlap:
+    def test_paragraph_groups_repeat_trailing_paragraphs(self):
+        chunker = DocumentChunker(chunk_size=200, min_chunk_size=60, num_overlapping_elements=1)
+        paragraphs = [f"Paragraph {i} has a few words of text." for i in range(6)]
+        chunks = chunker.apply([make_paragraph(p) for p in paragraphs], "doc1")
+
+        assert len(chunks) > 1
+        assert chunks[0].metadata["has_overlap"] is False
+        assert chunks[0].metadata["overlap_elements"] == 0
+        for previous, chunk in zip(chunks, chunks[1:]):
+            assert chunk.metadata["has_overlap"] is True
+            assert chunk.metadata["overlap_elements"] == 1
+            last_paragraph = previous.text.split("\n\n")[-1]
+            assert chunk.text.startswith(last_paragraph)
+            assert len(chunk.text) <= 200
+        assert all(p in "".join(c.text for c in chunks) for p in paragraphs)
+
+    def test_no_overlap_metadata_by_default(self):
+        chunker = DocumentChunker(chunk_size=200, min_chunk_size=60)
+        chunks = chunker.apply([make_paragraph(f"Paragraph {i} text here.") for i in range(6)], "doc1")
+        assert all("has_overlap" not in c.metadata for c in chunks)
+
+    def test_overlap_dropped_when_it_does_not_fit(self):
+        chunker = DocumentChunker(chunk_size=100, min_chunk_size=10, num_overlapping_elements=1)
+        nodes = [make_paragraph("a" * 60), make_paragraph("b" * 60)]
+        chunks = chunker.apply(nodes, "doc1")
+
+        assert [c.text for c in chunks] == ["a" * 60, "b" * 60]
+        assert chunks[1].metadata["overlap_elements"] == 0
+
+
 class TestExistingBehaviorUnchanged:
     def test_table_chunking_unchanged(self):
         chunker = DocumentChunker(chunk_size=1000)
@@ -68,6 +68,32 @@ class TestProcessDocuments:
         assert chunker.process_documents(str(UNITTEST_DATA_DIR), "*.nomatch") == []
 
 
+class TestProcessMany:
+    def test_matches_serial_processing(self, chunker):
+        paths = [UNITTEST_DATA_DIR / "sample_table.docx", UNITTEST_DATA_DIR / "nested_lists.docx"]
+        results = chunker.process_many(paths, max_workers=2)
+
+        assert list(results) == [str(p) for p in paths]
+        for path in paths:
+            expected = chunker.process_document(str(path))
+            assert [c.to_dict() for c in results[str(path)]] == [c.to_dict() for c in expected]
+
+    def test_works_after_processing_a_document(self, chunker):
+        # Inferring headings leaves lxml elements in the DOCX parser's state,
+        # which must not be pickled into the worker processes.
+        chunker.process_document(str(UNITTEST_DATA_DIR / "unstyled_headings.docx"))
+        paths = [UNITTEST_DATA_DIR / "sample_table.docx", UNITTEST_DATA_DIR / "nested_lists.docx"]
+        results = chunker.process_many(paths, max_workers=2)
+
+        for path in paths:
+            expected = chunker.process_document(str(path))
+            assert [c.to_dict() for c in results[str(path)]] == [c.to_dict() for c in expected]
+
+    def test_missing_file_raises(self, chunker):
+        with pytest.raises(FileNotFoundError):
+            chunker.process_many(["/nonexistent/a.docx", "/nonexistent/b.docx"], max_workers=2)
+
+
 class TestExportChunksToJson:
     def test_round_trip_preserves_text_and_metadata(self, chunker, tmp_path):
         chunks = [
@@ -180,6 +206,18 @@ class TestChunkerConfiguration:
             assert chunker.processors[name].chunker.chunk_size == 555
             assert chunker.processors[name].chunker.num_overlapping_elements == 3
 
+    def test_stream_tables_propagates_to_docx_parser(self):
+        assert DocChunker().processors["docx"].parser.stream_tables is False
+        assert DocChunker(stream_tables=True).processors["docx"].parser.stream_tables is True
+
+    def test_stream_tables_matches_materialized_tables(self, chunker):
+        docx_file = UNITTEST_DATA_DIR / "sample_table.docx"
+        if not docx_file.exists():
+            pytest.skip(f"Test file not found: {docx_file}")
+        streamed = DocChunker(chunk_size=1000, stream_tables=True).process_document(docx_file)
+        expected = chunker.process_document(docx_file)
+        assert [c.to_dict() for c in streamed] == [c.to_dict() for c in expected]
+
     def test_supported_formats_registered(self):
         chunker = DocChunker()
         assert set(chunker.processors) == {"docx", "pdf"}
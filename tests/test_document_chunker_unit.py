@@ -79,6 +79,22 @@ class TestApplyTables:
         assert "Table Header: Alpha | Beta" in chunks[0].text
         assert chunks[0].metadata["document_id"] == DOC_ID
 
+    def test_header_only_streamed_table_emits_header_chunk(self):
+        nodes = [{"type": "table", "header": ["Alpha"], "data_rows": lambda: iter([]), "children": []}]
+        chunks = make_chunker().apply(nodes, DOC_ID)
+
+        assert len(chunks) == 1
+        assert chunks[0].metadata["node_type"] == "table_header_only"
+
+    def test_streamed_rows_match_materialized_rows(self):
+        rows = [[f"item-{i:02d}", "x" * 80] for i in range(20)]
+        eager = [{"type": "table", "header": ["Key", "Value"], "data_rows": rows, "children": []}]
+        lazy = [{"type": "table", "header": ["Key", "Value"], "data_rows": lambda: iter(rows), "children": []}]
+
+        eager_chunks = make_chunker(chunk_size=300, overlap=1).apply(eager, DOC_ID)
+        lazy_chunks = make_chunker(chunk_size=300, overlap=1).apply(lazy, DOC_ID)
+        assert [c.to_dict() for c in lazy_chunks] == [c.to_dict() for c in eager_chunks]
+
     def test_table_row_pairs_cells_with_header_labels(self):
         nodes = [{
             "type": "table",
@@ -303,6 +319,24 @@ class TestStringification:
         chunker = make_chunker()
         assert chunker._stringify_node_content({"type": "mystery", "children": []}) == ""
 
+    def test_nested_children_keep_document_order_and_indentation(self):
+        chunker = make_chunker()
+        node = list_item("a", children=[
+            list_item("a.1", level=1, children=[list_item("a.1.1", level=2)]),
+            list_item("a.2", level=1),
+        ])
+        assert chunker._stringify_node_content(node).splitlines() == [
+            "- a", "  2. a.1", "    - a.1.1", "  2. a.2",
+        ]
+
+    def test_nesting_deeper_than_recursion_limit_is_stringified(self):
+        chunker = make_chunker()
+        node = list_item("leaf")
+        for depth in range(2000):
+            node = list_item(f"level {depth}", children=[node])
+        text = chunker._stringify_node_content(node)
+        assert text.rstrip().endswith("- leaf")
+
 
 class TestMetadataContract:
     def test_every_chunk_has_required_metadata_keys(self):
@@ -30,6 +30,19 @@ def add_numbered_list_item(doc: Document, text: str, ilvl: int, num_id: int) ->
     p_pr.append(num_pr)
 
 
+def add_hyperlink(paragraph, text: str) -> None:
+    """Append a w:hyperlink holding a single run with ``text`` to a paragraph."""
+    hyperlink = OxmlElement("w:hyperlink")
+    hyperlink.set(qn("w:anchor"), "target")
+    run = OxmlElement("w:r")
+    text_el = OxmlElement("w:t")
+    text_el.text = text
+    text_el.set(qn("xml:space"), "preserve")
+    run.append(text_el)
+    hyperlink.append(run)
+    paragraph._p.append(hyperlink)
+
+
 def parse(build_fn) -> list[dict]:
     doc = Document()
     build_fn(doc)
@@ -62,6 +75,25 @@ class TestRootLevelStructures:
         assert elements[0]["type"] == "paragraph"
         assert elements[0]["content"] == "standalone paragraph"
 
+    def test_hyperlink_text_is_kept_in_order(self):
+        def build(doc):
+            paragraph = doc.add_paragraph("See ")
+            add_hyperlink(paragraph, "the docs")
+            paragraph.add_run(" for details")
+
+        elements = parse(build)
+        assert [e["content"] for e in elements] == ["See the docs for details"]
+
+    def test_hyperlink_only_table_cell(self):
+        def build(doc):
+            table = doc.add_table(rows=2, cols=1)
+            table.cell(0, 0).text = "Link"
+            add_hyperlink(table.cell(1, 0).paragraphs[0], "example")
+
+        elements = parse(build)
+        table = next(e for e in elements if e["type"] == "table")
+        assert table["data_rows"] == [["example"]]
+
     def test_empty_paragraphs_are_skipped(self):
         def build(doc):
             doc.add_paragraph("")
@@ -137,6 +169,30 @@ class TestHeadingHierarchy:
         assert inner["children"][0]["content"] == "innermost text"
 
 
+class TestStyleResolution:
+    def test_heading_detected_by_style_name_not_style_id(self):
+        def build(doc):
+            # A localized heading style: the ID differs from the UI name.
+            doc.styles["Heading 2"].element.set(qn("w:styleId"), "berschrift2")
+            doc.add_paragraph("Localized", style="Heading 2")
+            doc.add_paragraph("Body text.")
+
+        elements = parse(build)
+        assert elements[0]["type"] == "heading"
+        assert elements[0]["level"] == 2
+        assert elements[0]["children"][0]["content"] == "Body text."
+
+    def test_unknown_style_id_falls_back_to_default_style(self):
+        def build(doc):
+            paragraph = doc.add_paragraph("Orphan style")
+            p_style = OxmlElement("w:pStyle")
+            p_style.set(qn("w:val"), "Heading1Missing")
+            paragraph._p.get_or_add_pPr().insert(0, p_style)
+
+        elements = parse(build)
+        assert elements[0]["type"] == "paragraph"
+
+
 class TestTableParsing:
     def test_first_row_becomes_header_rest_become_data_rows(self):
         def build(doc):
@@ -168,3 +224,75 @@ class TestTableParsing:
         elements = parse(build)
         table = next(e for e in elements if e["type"] == "table")
         assert table["data_rows"] == [["kept", ""]]
+
+    def test_stream_tables_yields_rows_lazily(self):
+        doc = Document()
+        table = doc.add_table(rows=3, cols=2)
+        table.cell(0, 0).text = "H1"
+        table.cell(0, 1).text = "H2"
+        table.cell(2, 0).text = "kept"
+        buffer = BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
+
+        elements = DocxParser(stream_tables=True).apply(buffer)
+        table_node = next(e for e in elements if e["type"] == "table")
+        assert table_node["header"] == ["H1", "H2"]
+        assert callable(table_node["data_rows"])
+        assert list(table_node["data_rows"]()) == [["kept", ""]]
+
+    def test_merged_cells_repeat_text_across_span(self):
+        def build(doc):
+            table = doc.add_table(rows=3, cols=3)
+            for col, text in enumerate(["A", "B", "C"]):
+                table.cell(0, col).text = text
+            table.cell(1, 0).merge(table.cell(1, 1)).text = "wide"
+            table.cell(1, 2).merge(table.cell(2, 2)).text = "tall"
+            table.cell(2, 0).text = "x"
+
+        elements = parse(build)
+        table = next(e for e in elements if e["type"] == "table")
+        assert table["data_rows"] == [["wide", "wide", "tall"], ["x", "", "tall"]]
+
+    def test_vertical_merge_over_several_rows_resolves_to_first_cell(self):
+        def build(doc):
+            table = doc.add_table(rows=4, cols=2)
+            table.cell(0, 0).text = "Group"
+            table.cell(0, 1).text = "Item"
+            table.cell(1, 0).merge(table.cell(3, 0)).text = "g1"
+            for row in range(1, 4):
+                table.cell(row, 1).text = f"i{row}"
+
+        elements = parse(build)
+        table = next(e for e in elements if e["type"] == "table")
+        assert table["data_rows"] == [["g1", "i1"], ["g1", "i2"], ["g1", "i3"]]
+
+    def test_vertical_merge_below_grid_before_row(self):
+        def build(doc):
+            table = doc.add_table(rows=3, cols=2)
+            table.cell(0, 0).text = "A"
+            table.cell(0, 1).text = "B"
+            table.cell(1, 0).text = "a1"
+            table.cell(1, 1).merge(table.cell(2, 1)).text = "tall"
+            # Last row skips the first grid column: its only cell is the
+            # merge continuation in column 2.
+            tr = table.rows[2]._tr
+            tr.remove(tr.tc_lst[0])
+            tr_pr = OxmlElement("w:trPr")
+            grid_before = OxmlElement("w:gridBefore")
+            grid_before.set(qn("w:val"), "1")
+            tr_pr.append(grid_before)
+            tr.insert(0, tr_pr)
+
+        elements = parse(build)
+        table = next(e for e in elements if e["type"] == "table")
+        assert table["data_rows"] == [["a1", "tall"], ["tall"]]
+
+    def test_merge_probe_detects_only_real_merges(self):
+        doc = Document()
+        plain = doc.add_table(rows=2, cols=2)
+        merged = doc.add_table(rows=2, cols=2)
+        merged.cell(0, 0).merge(merged.cell(1, 0))
+
+        assert DocxParser._table_has_merged_cells(plain._tbl) is False
+        assert DocxParser._table_has_merged_cells(merged._tbl) is True
@@ -5,12 +5,15 @@ pure-heuristic helpers with synthetic inputs and force the PyPDF fallback on a
 real fixture so both extraction backends stay tested.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 
 import pytest
 
 from docchunker import DocChunker
+from docchunker.processors import pdf_parser
 from docchunker.processors.pdf_parser import PdfParser
 
 UNITTEST_DATA_DIR = Path(__file__).parent.parent / "data" / "unittests"
@@ -25,6 +28,24 @@ def parser():
     return PdfParser()
 
 
+def scaling_ratio(func, make_input, n: int) -> float:
+    """Best-of-three runtime of ``func`` on a 2n-sized input over an n-sized one.
+
+    Roughly 2 for linear code and 4 for quadratic code, independent of how fast
+    the machine is.
+    """
+    def best_time(size: int) -> float:
+        data = make_input(size)
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func(data)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return best_time(2 * n) / best_time(n)
+
+
 class TestPypdfFallback:
     def test_fallback_parses_real_pdf_from_path(self, parser):
         if not SAMPLE_PDF.exists():
@@ -95,6 +116,18 @@ class TestDetectListItem:
     def test_non_list_text_returns_none(self, parser, text):
         assert parser._detect_list_item(text) is None
 
+    def test_long_whitespace_run_does_not_backtrack(self, parser):
+        # With a marker, a long whitespace run and a mid-line newline, the old
+        # "\s+(.+)$" tail backtracked quadratically in the whitespace length.
+        def make_line(n):
+            return "- " + " " * n + "a\nb"
+
+        assert parser._detect_list_item(make_line(1000)) is None
+        assert scaling_ratio(parser._detect_list_item, make_line, 1_000_000) < 3
+
+    def test_whitespace_only_content_is_not_a_list_item(self, parser):
+        assert parser._detect_list_item("-   ") is None
+
 
 class TestLineMarkerDetection:
     @pytest.mark.parametrize("text, content", [
@@ -193,6 +226,134 @@ class TestLinesLikelyConnected:
         assert parser._lines_likely_connected("line without punctuation", "More text") is True
 
 
+class TestPyMuPdfPages:
+    def test_pages_without_text_skip_table_detection(self, parser, monkeypatch):
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        doc.new_page()  # blank page
+        doc.new_page().insert_text((72, 72), "Only page with text")
+        pdf_bytes = doc.tobytes()
+        doc.close()
+
+        scanned_pages = []
+        original = parser._extract_tables
+        monkeypatch.setattr(parser, "_extract_tables", lambda page: scanned_pages.append(page.number) or original(page))
+        elements = parser.apply(BytesIO(pdf_bytes))
+
+        assert scanned_pages == [1]
+        assert [e["content"] for e in elements] == ["Only page with text"]
+
+
+class TestParsedDocumentCache:
+    @staticmethod
+    def write_pdf(path, text):
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), text)
+        doc.save(str(path))
+        doc.close()
+
+    def test_unchanged_file_is_not_reparsed(self, parser, tmp_path, monkeypatch):
+        pdf_path = tmp_path / "doc.pdf"
+        self.write_pdf(pdf_path, "Cached text")
+        first = parser.apply(str(pdf_path))
+
+        monkeypatch.setattr(parser, "_extract_flat_elements_with_pymupdf",
+                            lambda doc: pytest.fail("file was parsed again"))
+        assert parser.apply(str(pdf_path)) == first
+
+    def test_rewritten_file_is_reparsed(self, parser, tmp_path):
+        pdf_path = tmp_path / "doc.pdf"
+        self.write_pdf(pdf_path, "First version")
+        assert parser.apply(str(pdf_path))[0]["content"] == "First version"
+
+        self.write_pdf(pdf_path, "Second version of the text")
+        assert parser.apply(str(pdf_path))[0]["content"] == "Second version of the text"
+
+    def test_same_bytes_are_not_reparsed(self, parser, tmp_path, monkeypatch):
+        pdf_path = tmp_path / "doc.pdf"
+        self.write_pdf(pdf_path, "In-memory text")
+        pdf_bytes = pdf_path.read_bytes()
+        first = parser.apply(BytesIO(pdf_bytes))
+
+        monkeypatch.setattr(parser, "_extract_flat_elements_with_pymupdf",
+                            lambda doc: pytest.fail("document was parsed again"))
+        assert parser.apply(BytesIO(pdf_bytes)) == first
+
+    def test_open_file_matches_path(self, parser, tmp_path):
+        pdf_path = tmp_path / "doc.pdf"
+        self.write_pdf(pdf_path, "Memory-mapped text")
+        with open(pdf_path, "rb") as f:
+            from_file = parser.apply(f)
+            assert f.read(5) == b"%PDF-"  # file is left usable
+        assert from_file == parser.apply(str(pdf_path))
+
+    def test_bytesio_is_released_after_parsing(self, parser, tmp_path):
+        pdf_path = tmp_path / "doc.pdf"
+        self.write_pdf(pdf_path, "Viewed in place")
+        stream = BytesIO(pdf_path.read_bytes())
+        assert parser.apply(stream)[0]["content"] == "Viewed in place"
+        stream.write(b"resizable again")  # fails while a buffer view is held
+
+    def test_bytesio_with_pymupdf_rejecting_memoryview(self, parser, tmp_path, monkeypatch):
+        # PyMuPDF 1.23 raises TypeError("bad type: 'stream'") for a memoryview.
+        fitz = pytest.importorskip("fitz")
+        original_open = fitz.open
+
+        def strict_open(*args, stream=None, **kwargs):
+            if stream is not None and not isinstance(stream, bytes):
+                raise TypeError("bad type: 'stream'")
+            return original_open(*args, stream=stream, **kwargs)
+
+        monkeypatch.setattr(fitz, "open", strict_open)
+        pdf_path = tmp_path / "doc.pdf"
+        self.write_pdf(pdf_path, "Copied to bytes")
+        assert parser.apply(BytesIO(pdf_path.read_bytes()))[0]["content"] == "Copied to bytes"
+
+    def test_shared_parser_with_evicting_cache_across_threads(self, parser, tmp_path, monkeypatch):
+        monkeypatch.setattr(pdf_parser, "_FLAT_ELEMENTS_CACHE_SIZE", 1)
+        paths = []
+        for i in range(3):
+            paths.append(tmp_path / f"doc{i}.pdf")
+            self.write_pdf(paths[-1], f"Document {i}")
+
+        def parse_content(i):
+            return parser.apply(str(paths[i % 3]))[0]["content"]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contents = list(executor.map(parse_content, range(60)))
+        assert contents == [f"Document {i % 3}" for i in range(60)]
+
+    def test_results_do_not_share_elements(self, parser, tmp_path):
+        pdf_path = tmp_path / "doc.pdf"
+        self.write_pdf(pdf_path, "Shared text")
+        first = parser.apply(str(pdf_path))
+        first[0]["content"] = "changed"
+        assert parser.apply(str(pdf_path))[0]["content"] == "Shared text"
+
+
+class TestGroupLinesIntoParagraphs:
+    @staticmethod
+    def span(text, font, size=12.0, flags=0):
+        return {"text": text, "font": font, "size": size, "flags": flags}
+
+    def test_dominant_font_ties_resolve_to_first_seen(self, parser):
+        lines = [{
+            "bbox": (0, 0, 100, 12),
+            "spans": [self.span("one ", "Serif"), self.span("two", "Sans")],
+        }]
+        paragraphs = parser._group_lines_into_paragraphs(lines)
+        assert paragraphs[0][0]["font_family"] == "Serif"
+
+    def test_dominant_font_is_most_frequent(self, parser):
+        lines = [{
+            "bbox": (0, 0, 100, 12),
+            "spans": [self.span("a ", "Serif"), self.span("b ", "Sans"), self.span("c", "Sans")],
+        }]
+        paragraphs = parser._group_lines_into_paragraphs(lines)
+        assert paragraphs[0][0]["font_family"] == "Sans"
+
+
 class TestFontStatistics:
     def test_empty_blocks_return_defaults(self, parser):
         stats = parser._calculate_font_statistics([])
@@ -258,28 +419,44 @@ class TestFallbackHeuristics:
     def test_looks_like_new_section(self, parser, text, expected):
         assert parser._looks_like_new_section(text) is expected
 
+    @pytest.mark.parametrize("text, expected", [
+        ("one\n\n  \ntwo", ["one", "two"]),
+        ("intro\nSetup notes\ncontinue: here", ["intro", "Setup notes\ncontinue: here"]),
+        ("intro\nSetup. Then: more", ["intro\nSetup. Then: more"]),
+        ("intro\n  12. Numbered", ["intro", "  12. Numbered"]),
+        ("intro\n12 items", ["intro\n12 items"]),
+        ("no breaks at all", ["no breaks at all"]),
+    ])
+    def test_split_paragraphs(self, parser, text, expected):
+        assert parser._split_paragraphs(text) == expected
+
+    def test_split_paragraphs_is_linear_without_periods(self, parser):
+        # The former lookahead regex rescanned to the next period (here: the
+        # end of the text) after every newline, quadratic in the page length.
+        assert len(parser._split_paragraphs("Line without a period\n" * 1000)) == 1
+        ratio = scaling_ratio(parser._split_paragraphs, lambda n: "Line without a period\n" * n, 50_000)
+        assert ratio < 3
+
 
 class TestProcessTextBlock:
     def test_empty_text_returns_none(self, parser):
-        assert parser._process_text_block({"text": "   ", "font_size": 12}, 12.0) is None
+        assert parser._process_text_block("", 12, 12.0) is None
 
     def test_large_font_becomes_heading(self, parser):
-        element = parser._process_text_block({"text": "Big Title", "font_size": 24}, 12.0)
+        element = parser._process_text_block("Big Title", 24, 12.0)
         assert element is not None
         assert element["type"] == "heading"
         assert element["level"] == 1
 
     def test_list_marker_becomes_list_item(self, parser):
-        element = parser._process_text_block({"text": "- bullet content", "font_size": 12}, 12.0)
+        element = parser._process_text_block("- bullet content", 12, 12.0)
         assert element is not None
         assert element["type"] == "list_item"
         assert element["content"] == "bullet content"
 
     def test_plain_text_becomes_paragraph(self, parser):
         element = parser._process_text_block(
-            {"text": "An ordinary paragraph of body text that describes something mundane.",
-             "font_size": 12},
-            12.0,
+            "An ordinary paragraph of body text that describes something mundane.", 12, 12.0,
         )
         assert element is not None
         assert element["type"] == "paragraph"